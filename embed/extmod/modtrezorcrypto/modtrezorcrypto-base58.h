@@ -0,0 +1,100 @@
+/*
+ * This file is part of the TREZOR project, https://trezor.io/
+ *
+ * Copyright (c) SatoshiLabs
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "py/objstr.h"
+
+#include "base58.h"
+
+// b58enc() and b58tobin() keep their working buffers on the stack
+#define BASE58_MAX_DATA_LEN 1024
+#define BASE58_MAX_STRING_LEN 1400
+
+/// package: trezorcrypto.base58
+
+/// def encode(data: bytes) -> str:
+///     '''
+///     Convert bytes to base58 encoded string.
+///     '''
+STATIC mp_obj_t mod_trezorcrypto_base58_encode(mp_obj_t data) {
+  mp_buffer_info_t bin;
+  mp_get_buffer_raise(data, &bin, MP_BUFFER_READ);
+  if (bin.len > BASE58_MAX_DATA_LEN) {
+    mp_raise_ValueError("Input too long");
+  }
+  // log(256) / log(58) < 1.38, + 1 for rounding, + 1 for the 0 byte
+  size_t size = bin.len * 138 / 100 + 2;
+  vstr_t vstr;
+  vstr_init_len(&vstr, size);
+  if (!b58enc(vstr.buf, &size, bin.buf, bin.len)) {
+    vstr_clear(&vstr);
+    mp_raise_ValueError("Failed to encode");
+  }
+  vstr.len = size - 1;  // without the 0 byte
+  return mp_obj_new_str_from_vstr(&mp_type_str, &vstr);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_trezorcrypto_base58_encode_obj,
+                                 mod_trezorcrypto_base58_encode);
+
+/// def decode(string: str) -> bytes:
+///     '''
+///     Convert base58 encoded string to bytes.
+///     '''
+STATIC mp_obj_t mod_trezorcrypto_base58_decode(mp_obj_t string) {
+  mp_buffer_info_t str;
+  mp_get_buffer_raise(string, &str, MP_BUFFER_READ);
+  if (str.len == 0) {
+    return mp_obj_new_bytes((const uint8_t *)"", 0);
+  }
+  if (str.len > BASE58_MAX_STRING_LEN) {
+    mp_raise_ValueError("Input too long");
+  }
+  // b58tobin() expects a 0-terminated string
+  char b58[str.len + 1];
+  memcpy(b58, str.buf, str.len);
+  b58[str.len] = 0;
+  // every character encodes at most one byte, including the leading zeros
+  size_t size = str.len;
+  vstr_t vstr;
+  vstr_init_len(&vstr, size);
+  if (!b58tobin(vstr.buf, &size, b58)) {
+    vstr_clear(&vstr);
+    mp_raise_ValueError("Invalid base58 string");
+  }
+  // the result is aligned to the end of the buffer
+  memmove(vstr.buf, vstr.buf + str.len - size, size);
+  vstr.len = size;
+  return mp_obj_new_str_from_vstr(&mp_type_bytes, &vstr);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_trezorcrypto_base58_decode_obj,
+                                 mod_trezorcrypto_base58_decode);
+
+STATIC const mp_rom_map_elem_t mod_trezorcrypto_base58_globals_table[] = {
+    {MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_base58)},
+    {MP_ROM_QSTR(MP_QSTR_encode),
+     MP_ROM_PTR(&mod_trezorcrypto_base58_encode_obj)},
+    {MP_ROM_QSTR(MP_QSTR_decode),
+     MP_ROM_PTR(&mod_trezorcrypto_base58_decode_obj)},
+};
+STATIC MP_DEFINE_CONST_DICT(mod_trezorcrypto_base58_globals,
+                            mod_trezorcrypto_base58_globals_table);
+
+STATIC const mp_obj_module_t mod_trezorcrypto_base58_module = {
+    .base = {&mp_type_module},
+    .globals = (mp_obj_dict_t *)&mod_trezorcrypto_base58_globals,
+};
@@ -24,6 +24,36 @@
 
 /// package: trezorcrypto.bip39
 
+// The wordlist is sorted, so all words starting with a given prefix form
+// a contiguous range, which is found by binary search.
+
+static int wordlist_len(void) {
+  static int len = 0;
+  if (len == 0) {
+    for (const char *const *w = mnemonic_wordlist(); *w != 0; w++) {
+      len++;
+    }
+  }
+  return len;
+}
+
+// Return index of the first word which does not compare lower than the
+// prefix, or (if upper is true) of the first word which compares higher.
+static int wordlist_bound(const char *prefix, size_t len, bool upper) {
+  const char *const *wlist = mnemonic_wordlist();
+  int lo = 0, hi = wordlist_len();
+  while (lo < hi) {
+    const int mid = (lo + hi) / 2;
+    const int cmp = strncmp(wlist[mid], prefix, len);
+    if (cmp < 0 || (upper && cmp == 0)) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  return lo;
+}
+
 /// def find_word(prefix: str) -> Optional[str]:
 ///     '''
 ///     Return the first word from the wordlist starting with prefix.
@@ -34,9 +64,11 @@ STATIC mp_obj_t mod_trezorcrypto_bip39_find_word(mp_obj_t prefix) {
   if (pfx.len == 0) {
     return mp_const_none;
   }
-  for (const char *const *w = mnemonic_wordlist(); *w != 0; w++) {
-    if (strncmp(*w, pfx.buf, pfx.len) == 0) {
-      return mp_obj_new_str(*w, strlen(*w));
+  const int i = wordlist_bound(pfx.buf, pfx.len, false);
+  if (i < wordlist_len()) {
+    const char *w = mnemonic_wordlist()[i];
+    if (strncmp(w, pfx.buf, pfx.len) == 0) {
+      return mp_obj_new_str(w, strlen(w));
     }
   }
   return mp_const_none;
@@ -57,15 +89,28 @@ STATIC mp_obj_t mod_trezorcrypto_bip39_complete_word(mp_obj_t prefix) {
     return mp_obj_new_int(0xFFFFFFFF);  // all letters
   }
   uint32_t res = 0;
-  uint8_t bit;
-  const char *word;
-  const char *const *wlist;
-  for (wlist = mnemonic_wordlist(); *wlist != 0; wlist++) {
-    word = *wlist;
-    if (strncmp(word, pfx.buf, pfx.len) == 0 && strlen(word) > pfx.len) {
-      bit = word[pfx.len] - 'a';
-      res |= 1 << bit;
+  const char *const *wlist = mnemonic_wordlist();
+  int i = wordlist_bound(pfx.buf, pfx.len, false);
+  const int end = wordlist_bound(pfx.buf, pfx.len, true);
+  while (i < end) {
+    const uint8_t c = wlist[i][pfx.len];
+    if (c == 0) {
+      // the prefix itself is a word
+      i++;
+      continue;
+    }
+    res |= 1 << (c - 'a');
+    // skip all words continuing with the same letter
+    int lo = i + 1, hi = end;
+    while (lo < hi) {
+      const int mid = (lo + hi) / 2;
+      if ((uint8_t)wlist[mid][pfx.len] <= c) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
     }
+    i = lo;
   }
   return mp_obj_new_int(res);
 }
@@ -1230,6 +1230,116 @@ STATIC MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(
     mod_trezorcrypto_monero_xmr_gen_c_obj, 2, 3,
     mod_trezorcrypto_monero_xmr_gen_c);
 
+/// def xmr_mlsag_chain(c: Sc25519, cc: Sc25519, message: bytes, pk: bytes,
+/// II: bytes, rows: int, ds_rows: int, index: int, mg_buff: List[bytearray],
+/// ss_offset: int) -> Sc25519:
+///     '''
+///     MLSAG challenge chain over all ring columns except `index`.
+///     `pk` is the packed ring, column-major, `rows` keys per column,
+///     `II` are the packed key images of the first `ds_rows` rows.
+///     Random ss[i] are written to mg_buff[i + 1] at `ss_offset`.
+///     On return `c` holds the challenge for column `index` and
+///     `cc` the challenge for column 0.
+///     '''
+STATIC mp_obj_t mod_trezorcrypto_monero_xmr_mlsag_chain(size_t n_args,
+                                                        const mp_obj_t *args) {
+  assert_scalar(args[0]);
+  assert_scalar(args[1]);
+
+  mp_buffer_info_t message, pk, ki;
+  mp_get_buffer_raise(args[2], &message, MP_BUFFER_READ);
+  mp_get_buffer_raise(args[3], &pk, MP_BUFFER_READ);
+  mp_get_buffer_raise(args[4], &ki, MP_BUFFER_READ);
+
+  const mp_int_t rows = mp_obj_get_int(args[5]);
+  const mp_int_t ds_rows = mp_obj_get_int(args[6]);
+  const mp_int_t index = mp_obj_get_int(args[7]);
+  const mp_int_t ss_offset = mp_obj_get_int(args[9]);
+  if (rows <= 0 || ds_rows < 0 || ds_rows > rows || ss_offset < 0) {
+    mp_raise_ValueError("Invalid ring dimensions");
+  }
+
+  const mp_int_t cols = pk.len / (32 * rows);
+  if (cols <= 1 || (size_t)(cols * rows * 32) != pk.len || index < 0 ||
+      index >= cols) {
+    mp_raise_ValueError("Invalid ring dimensions");
+  }
+  if (ki.len < (size_t)(32 * ds_rows)) {
+    mp_raise_ValueError("Invalid length of key images");
+  }
+
+  size_t mg_len = 0;
+  mp_obj_t *mg_items = NULL;
+  mp_obj_get_array(args[8], &mg_len, &mg_items);
+  if (mg_len < (size_t)(cols + 1)) {
+    mp_raise_ValueError("Signature buffer too small");
+  }
+
+  bignum256modm ss;
+  ge25519 P, L, R, Hi, Ii;
+  uint8_t buff[32];
+  Hasher hasher;
+
+  mp_int_t i = (index + 1) % cols;
+  if (i == 0) {
+    copy256_modm(MP_OBJ_SCALAR(args[1]), MP_OBJ_C_SCALAR(args[0]));
+  }
+
+  while (i != index) {
+    mp_buffer_info_t out;
+    mp_get_buffer_raise(mg_items[i + 1], &out, MP_BUFFER_WRITE);
+    if (out.len < (size_t)(ss_offset + 32 * rows)) {
+      mp_raise_ValueError("Buffer too small");
+    }
+
+    xmr_hasher_init(&hasher);
+    xmr_hasher_update(&hasher, message.buf, message.len);
+
+    for (mp_int_t j = 0; j < rows; j++) {
+      const uint8_t *pk_ij = ((const uint8_t *)pk.buf) + 32 * (i * rows + j);
+      xmr_random_scalar(ss);
+
+      // L = ss[i][j] * G + c_old * pk[i][j]
+      if (ge25519_unpack_vartime(&P, pk_ij) != 1) {
+        mp_raise_ValueError("Point decoding error");
+      }
+      xmr_add_keys2_vartime(&L, ss, MP_OBJ_SCALAR(args[0]), &P);
+      xmr_hasher_update(&hasher, pk_ij, 32);
+      ge25519_pack(buff, &L);
+      xmr_hasher_update(&hasher, buff, 32);
+
+      // R = ss[i][j] * H(pk[i][j]) + c_old * II[j], omitted for commitments
+      if (j < ds_rows) {
+        xmr_hash_to_ec(&Hi, pk_ij, 32);
+        if (ge25519_unpack_vartime(&Ii, ((const uint8_t *)ki.buf) + 32 * j) !=
+            1) {
+          mp_raise_ValueError("Point decoding error");
+        }
+        xmr_add_keys3_vartime(&R, ss, &Hi, MP_OBJ_SCALAR(args[0]), &Ii);
+        ge25519_pack(buff, &R);
+        xmr_hasher_update(&hasher, buff, 32);
+      }
+
+      contract256_modm(((uint8_t *)out.buf) + ss_offset + 32 * j, ss);
+    }
+
+    xmr_hasher_final(&hasher, buff);
+    expand256_modm(MP_OBJ_SCALAR(args[0]), buff, 32);
+
+    i = (i + 1) % cols;
+    if (i == 0) {
+      copy256_modm(MP_OBJ_SCALAR(args[1]), MP_OBJ_C_SCALAR(args[0]));
+    }
+  }
+
+  memzero(ss, sizeof(ss));
+  memzero(&hasher, sizeof(hasher));
+  return args[0];
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(
+    mod_trezorcrypto_monero_xmr_mlsag_chain_obj, 10, 10,
+    mod_trezorcrypto_monero_xmr_mlsag_chain);
+
 /// def ct_equals(a: bytes, b: bytes) -> bool:
 ///     '''
 ///     Constant time buffer comparison
@@ -1455,6 +1565,8 @@ STATIC const mp_rom_map_elem_t mod_trezorcrypto_monero_globals_table[] = {
      MP_ROM_PTR(&mod_trezorcrypto_monero_xmr_get_subaddress_secret_key_obj)},
     {MP_ROM_QSTR(MP_QSTR_xmr_gen_c),
      MP_ROM_PTR(&mod_trezorcrypto_monero_xmr_gen_c_obj)},
+    {MP_ROM_QSTR(MP_QSTR_xmr_mlsag_chain),
+     MP_ROM_PTR(&mod_trezorcrypto_monero_xmr_mlsag_chain_obj)},
     {MP_ROM_QSTR(MP_QSTR_ct_equals),
      MP_ROM_PTR(&mod_trezorcrypto_ct_equals_obj)},
 };
@@ -638,21 +638,27 @@ int display_text_width(const char *text, int textlen, int font) {
   return width;
 }
 
-#define QR_MAX_VERSION 9
-
-void display_qrcode(int x, int y, const char *data, int datalen,
-                    uint8_t scale) {
-  if (scale < 1 || scale > 10) return;
-
-  uint8_t codedata[qrcodegen_BUFFER_LEN_FOR_VERSION(QR_MAX_VERSION)];
+// encode data into a QR code matrix, return the length of the matrix
+int display_qrcode_encode(const char *data, int datalen,
+                          uint8_t matrix[QR_MAX_MATRIX_LEN]) {
   uint8_t tempdata[qrcodegen_BUFFER_LEN_FOR_VERSION(QR_MAX_VERSION)];
 
-  int side = 0;
-  if (qrcodegen_encodeText(data, tempdata, codedata, qrcodegen_Ecc_MEDIUM,
-                           qrcodegen_VERSION_MIN, QR_MAX_VERSION,
-                           qrcodegen_Mask_AUTO, true)) {
-    side = qrcodegen_getSize(codedata);
+  if (!qrcodegen_encodeText(data, tempdata, matrix, qrcodegen_Ecc_MEDIUM,
+                            qrcodegen_VERSION_MIN, QR_MAX_VERSION,
+                            qrcodegen_Mask_AUTO, true)) {
+    matrix[0] = 0;  // empty code, only the border is drawn
+    return 1;
   }
+  const int side = qrcodegen_getSize(matrix);
+  return (side * side + 7) / 8 + 1;
+}
+
+// draw a QR code matrix produced by display_qrcode_encode
+void display_qrcode_matrix(int x, int y, const uint8_t *matrix,
+                           uint8_t scale) {
+  if (scale < 1 || scale > 10) return;
+
+  const int side = matrix[0];
 
   x += DISPLAY_OFFSET.x - (side + 2) * scale / 2;
   y += DISPLAY_OFFSET.y - (side + 2) * scale / 2;
@@ -669,7 +675,7 @@ void display_qrcode(int x, int y, const char *data, int datalen,
         PIXELDATA(0xFFFF);
         continue;
       }
-      if (qrcodegen_getModule(codedata, rx, ry)) {
+      if (qrcodegen_getModule(matrix, rx, ry)) {
         PIXELDATA(0x0000);
       } else {
         PIXELDATA(0xFFFF);
@@ -678,6 +684,15 @@ void display_qrcode(int x, int y, const char *data, int datalen,
   }
 }
 
+void display_qrcode(int x, int y, const char *data, int datalen,
+                    uint8_t scale) {
+  if (scale < 1 || scale > 10) return;
+
+  uint8_t matrix[QR_MAX_MATRIX_LEN];
+  display_qrcode_encode(data, datalen, matrix);
+  display_qrcode_matrix(x, y, matrix, scale);
+}
+
 void display_offset(int set_xy[2], int *get_x, int *get_y) {
   if (set_xy) {
     DISPLAY_OFFSET.x = set_xy[0];
@@ -101,7 +101,16 @@ void display_text_right(int x, int y, const char *text, int textlen, int font,
                         uint16_t fgcolor, uint16_t bgcolor);
 int display_text_width(const char *text, int textlen, int font);
 
+// size of the largest QR code matrix, as stored by qrcodegen: side length
+// in the first byte followed by the bitmap of modules
+#define QR_MAX_VERSION 9
+#define QR_MAX_SIDE (QR_MAX_VERSION * 4 + 17)
+#define QR_MAX_MATRIX_LEN ((QR_MAX_SIDE * QR_MAX_SIDE + 7) / 8 + 1)
+
 void display_qrcode(int x, int y, const char *data, int datalen, uint8_t scale);
+int display_qrcode_encode(const char *data, int datalen,
+                          uint8_t matrix[QR_MAX_MATRIX_LEN]);
+void display_qrcode_matrix(int x, int y, const uint8_t *matrix, uint8_t scale);
 
 void display_offset(int set_xy[2], int *get_x, int *get_y);
 int display_orientation(int degrees);
@@ -197,6 +197,75 @@ STATIC mp_obj_t mod_trezorui_Display_icon(size_t n_args, const mp_obj_t *args) {
 
 STATIC MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(mod_trezorui_Display_icon_obj, 6, 6,
                                            mod_trezorui_Display_icon);
+
+#define TOIF_STORED_BLOCK 0xFFFF
+
+static void inflate_callback_stored(uint8_t byte, uint32_t pos,
+                                    void *userdata) {
+  const mp_buffer_info_t *out = (const mp_buffer_info_t *)userdata;
+  // skip image header and the headers of all blocks up to the current one
+  const size_t offset = 12 + 5 * (pos / TOIF_STORED_BLOCK + 1) + pos;
+  if (offset < out->len) {
+    ((uint8_t *)out->buf)[offset] = byte;
+  }
+}
+
+/// def decompress(self, image: bytes) -> bytes:
+///     '''
+///     Returns the image (full-color or gray-scale TOIF) with its pixel data
+///     stored in uncompressed deflate blocks. Such image can be passed to any
+///     drawing method and is drawn without decoding Huffman codes, at the
+///     cost of being larger.
+///     '''
+STATIC mp_obj_t mod_trezorui_Display_decompress(mp_obj_t self,
+                                                mp_obj_t image) {
+  mp_buffer_info_t src;
+  mp_get_buffer_raise(image, &src, MP_BUFFER_READ);
+  const uint8_t *data = src.buf;
+  if (src.len < 12 || memcmp(data, "TOI", 3) != 0 ||
+      (data[3] != 'f' && data[3] != 'g')) {
+    mp_raise_ValueError("Invalid image format");
+  }
+  const uint32_t w = *(uint16_t *)(data + 4);
+  const uint32_t h = *(uint16_t *)(data + 6);
+  const uint32_t datalen = *(uint32_t *)(data + 8);
+  if (datalen != src.len - 12) {
+    mp_raise_ValueError("Invalid size of data");
+  }
+  const uint32_t rawlen = (data[3] == 'f') ? w * h * 2 : (w * h + 1) / 2;
+  if (rawlen == 0) {
+    mp_raise_ValueError("Invalid image size");
+  }
+  const uint32_t blocks = (rawlen + TOIF_STORED_BLOCK - 1) / TOIF_STORED_BLOCK;
+  const uint32_t outlen = rawlen + 5 * blocks;
+
+  vstr_t vstr;
+  vstr_init_len(&vstr, 12 + outlen);
+  uint8_t *out = (uint8_t *)vstr.buf;
+  memcpy(out, data, 8);
+  *(uint32_t *)(out + 8) = outlen;
+  for (uint32_t i = 0; i < blocks; i++) {
+    uint8_t *hdr = out + 12 + i * (5 + TOIF_STORED_BLOCK);
+    const uint32_t len = (i == blocks - 1)
+                             ? rawlen - i * TOIF_STORED_BLOCK
+                             : TOIF_STORED_BLOCK;
+    hdr[0] = (i == blocks - 1) ? 0x01 : 0x00;  // BFINAL, BTYPE = stored
+    hdr[1] = len & 0xFF;
+    hdr[2] = len >> 8;
+    hdr[3] = ~len & 0xFF;
+    hdr[4] = (~len >> 8) & 0xFF;
+  }
+
+  mp_buffer_info_t dst = {.buf = out, .len = 12 + outlen};
+  if (sinf_inflate(data + 12, datalen, inflate_callback_stored, &dst) != 0) {
+    vstr_clear(&vstr);
+    mp_raise_ValueError("Invalid image data");
+  }
+  return mp_obj_new_str_from_vstr(&mp_type_bytes, &vstr);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_2(mod_trezorui_Display_decompress_obj,
+                                 mod_trezorui_Display_decompress);
+
 /// def loader(self, progress: int, yoffset: int, fgcolor: int, bgcolor: int,
 /// icon: bytes = None, iconfgcolor: int = None) -> None:
 ///     '''
@@ -386,6 +455,60 @@ STATIC mp_obj_t mod_trezorui_Display_qrcode(size_t n_args,
 STATIC MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(mod_trezorui_Display_qrcode_obj, 5,
                                            5, mod_trezorui_Display_qrcode);
 
+/// def qrcode_encode(self, data: bytes) -> bytes:
+///     '''
+///     Encodes data as a QR code and returns its matrix as a packed bitmap,
+///     which can be drawn repeatedly by qrcode_matrix without encoding the
+///     data again.
+///     '''
+STATIC mp_obj_t mod_trezorui_Display_qrcode_encode(mp_obj_t self,
+                                                   mp_obj_t data) {
+  mp_buffer_info_t buf;
+  mp_get_buffer_raise(data, &buf, MP_BUFFER_READ);
+  vstr_t vstr;
+  vstr_init_len(&vstr, QR_MAX_MATRIX_LEN);
+  if (buf.len > 0) {
+    vstr.len = display_qrcode_encode(buf.buf, buf.len, (uint8_t *)vstr.buf);
+  } else {
+    vstr.buf[0] = 0;
+    vstr.len = 1;
+  }
+  return mp_obj_new_str_from_vstr(&mp_type_bytes, &vstr);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_2(mod_trezorui_Display_qrcode_encode_obj,
+                                 mod_trezorui_Display_qrcode_encode);
+
+/// def qrcode_matrix(self, x: int, y: int, matrix: bytes, scale: int) -> None:
+///     '''
+///     Renders a QR code matrix returned by qrcode_encode centered at position
+///     (x,y). Scale determines a zoom factor.
+///     '''
+STATIC mp_obj_t mod_trezorui_Display_qrcode_matrix(size_t n_args,
+                                                   const mp_obj_t *args) {
+  mp_int_t x = mp_obj_get_int(args[1]);
+  mp_int_t y = mp_obj_get_int(args[2]);
+  mp_int_t scale = mp_obj_get_int(args[4]);
+  if (scale < 1 || scale > 10) {
+    mp_raise_ValueError("Scale has to be between 1 and 10");
+  }
+  mp_buffer_info_t matrix;
+  mp_get_buffer_raise(args[3], &matrix, MP_BUFFER_READ);
+  const uint8_t *data = matrix.buf;
+  if (matrix.len < 1) {
+    mp_raise_ValueError("Invalid QR code matrix");
+  }
+  const int side = data[0];
+  if (side != 0 && (side < 21 || side > QR_MAX_SIDE || (side - 17) % 4 != 0 ||
+                    matrix.len != (side * side + 7) / 8 + 1)) {
+    mp_raise_ValueError("Invalid QR code matrix");
+  }
+  display_qrcode_matrix(x, y, data, scale);
+  return mp_const_none;
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(
+    mod_trezorui_Display_qrcode_matrix_obj, 5, 5,
+    mod_trezorui_Display_qrcode_matrix);
+
 /// def orientation(self, degrees: int = None) -> int:
 ///     '''
 ///     Sets display orientation to 0, 90, 180 or 270 degrees.
@@ -492,6 +615,8 @@ STATIC const mp_rom_map_elem_t mod_trezorui_Display_locals_dict_table[] = {
     {MP_ROM_QSTR(MP_QSTR_image), MP_ROM_PTR(&mod_trezorui_Display_image_obj)},
     {MP_ROM_QSTR(MP_QSTR_avatar), MP_ROM_PTR(&mod_trezorui_Display_avatar_obj)},
     {MP_ROM_QSTR(MP_QSTR_icon), MP_ROM_PTR(&mod_trezorui_Display_icon_obj)},
+    {MP_ROM_QSTR(MP_QSTR_decompress),
+     MP_ROM_PTR(&mod_trezorui_Display_decompress_obj)},
     {MP_ROM_QSTR(MP_QSTR_loader), MP_ROM_PTR(&mod_trezorui_Display_loader_obj)},
     {MP_ROM_QSTR(MP_QSTR_print), MP_ROM_PTR(&mod_trezorui_Display_print_obj)},
     {MP_ROM_QSTR(MP_QSTR_text), MP_ROM_PTR(&mod_trezorui_Display_text_obj)},
@@ -502,6 +627,10 @@ STATIC const mp_rom_map_elem_t mod_trezorui_Display_locals_dict_table[] = {
     {MP_ROM_QSTR(MP_QSTR_text_width),
      MP_ROM_PTR(&mod_trezorui_Display_text_width_obj)},
     {MP_ROM_QSTR(MP_QSTR_qrcode), MP_ROM_PTR(&mod_trezorui_Display_qrcode_obj)},
+    {MP_ROM_QSTR(MP_QSTR_qrcode_encode),
+     MP_ROM_PTR(&mod_trezorui_Display_qrcode_encode_obj)},
+    {MP_ROM_QSTR(MP_QSTR_qrcode_matrix),
+     MP_ROM_PTR(&mod_trezorui_Display_qrcode_matrix_obj)},
     {MP_ROM_QSTR(MP_QSTR_orientation),
      MP_ROM_PTR(&mod_trezorui_Display_orientation_obj)},
     {MP_ROM_QSTR(MP_QSTR_backlight),
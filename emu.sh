@@ -41,6 +41,18 @@ case "$1" in
         ../vendor/flamegraph/stackcollapse-perf.pl perf.trace | ../vendor/flamegraph/flamegraph.pl > perf.svg
         $BROWSER perf.svg
         ;;
+    "-b")
+        shift
+        TREZOR_PROFILER=1 ../$EXE $ARGS $* $MAIN > boot.trace &
+        UPY_PID=$!
+        while kill -0 $UPY_PID 2>/dev/null && ! grep -q "^profile:done" boot.trace; do
+            sleep 1
+        done
+        kill $UPY_PID 2>/dev/null
+        grep "^profile:time " boot.trace | cut -d" " -f2- | ../vendor/flamegraph/flamegraph.pl --countname us > boot-time.svg
+        grep "^profile:alloc " boot.trace | cut -d" " -f2- | ../vendor/flamegraph/flamegraph.pl --countname bytes > boot-alloc.svg
+        $BROWSER boot-time.svg boot-alloc.svg
+        ;;
     *)
         ../$EXE $ARGS $* $MAIN
 esac
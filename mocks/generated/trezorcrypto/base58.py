@@ -0,0 +1,13 @@
+from typing import *
+
+# extmod/modtrezorcrypto/modtrezorcrypto-base58.h
+def encode(data: bytes) -> str:
+    '''
+    Convert bytes to base58 encoded string.
+    '''
+
+# extmod/modtrezorcrypto/modtrezorcrypto-base58.h
+def decode(string: str) -> bytes:
+    '''
+    Convert base58 encoded string to bytes.
+    '''
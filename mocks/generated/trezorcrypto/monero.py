@@ -306,6 +306,17 @@ def xmr_gen_c(r: Optional[Ge25519], a: Sc25519, amount: int) -> Ge25519:
     aG + amount * H
     '''
 
+# extmod/modtrezorcrypto/modtrezorcrypto-monero.h
+def xmr_mlsag_chain(c: Sc25519, cc: Sc25519, message: bytes, pk: bytes, II: bytes, rows: int, ds_rows: int, index: int, mg_buff: List[bytearray], ss_offset: int) -> Sc25519:
+    '''
+    MLSAG challenge chain over all ring columns except `index`.
+    `pk` is the packed ring, column-major, `rows` keys per column,
+    `II` are the packed key images of the first `ds_rows` rows.
+    Random ss[i] are written to mg_buff[i + 1] at `ss_offset`.
+    On return `c` holds the challenge for column `index` and
+    `cc` the challenge for column 0.
+    '''
+
 # extmod/modtrezorcrypto/modtrezorcrypto-monero.h
 def ct_equals(a: bytes, b: bytes) -> bool:
     '''
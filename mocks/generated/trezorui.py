@@ -51,6 +51,14 @@ class Display:
         The icon needs to be in TREZOR Optimized Image Format (TOIF) - gray-scale mode.
         '''
 
+    def decompress(self, image: bytes) -> bytes:
+        '''
+        Returns the image (full-color or gray-scale TOIF) with its pixel data
+        stored in uncompressed deflate blocks. Such image can be passed to any
+        drawing method and is drawn without decoding Huffman codes, at the
+        cost of being larger.
+        '''
+
     def loader(self, progress: int, yoffset: int, fgcolor: int, bgcolor: int, icon: bytes = None, iconfgcolor: int = None) -> None:
         '''
         Renders a rotating loader graphic.
@@ -99,6 +107,19 @@ class Display:
         Scale determines a zoom factor.
         '''
 
+    def qrcode_encode(self, data: bytes) -> bytes:
+        '''
+        Encodes data as a QR code and returns its matrix as a packed bitmap,
+        which can be drawn repeatedly by qrcode_matrix without encoding the
+        data again.
+        '''
+
+    def qrcode_matrix(self, x: int, y: int, matrix: bytes, scale: int) -> None:
+        '''
+        Renders a QR code matrix returned by qrcode_encode centered at position
+        (x,y). Scale determines a zoom factor.
+        '''
+
     def orientation(self, degrees: int = None) -> int:
         '''
         Sets display orientation to 0, 90, 180 or 270 degrees.
@@ -6,14 +6,16 @@ from apps.common import HARDENED
 from apps.common.seed import remove_ed25519_prefix
 
 
-def _encode_address_raw(address_data_encoded):
-    return base58.encode(
-        cbor.encode(
-            [cbor.Tagged(24, address_data_encoded), crc.crc32(address_data_encoded)]
-        )
+def _encode_address_cbor(address_data_encoded):
+    return cbor.encode(
+        [cbor.Tagged(24, address_data_encoded), crc.crc32(address_data_encoded)]
     )
 
 
+def _encode_address_raw(address_data_encoded):
+    return base58.encode(_encode_address_cbor(address_data_encoded))
+
+
 def derive_address_and_node(keychain, path: list):
     node = keychain.derive(path)
 
@@ -49,7 +51,8 @@ def is_safe_output_address(address) -> bool:
     if not isinstance(address_data_encoded, bytes):
         return False
 
-    return _encode_address_raw(address_data_encoded) == address
+    # base58 decoding is one-to-one, so comparing the raw bytes is enough
+    return _encode_address_cbor(address_data_encoded) == address_hex
 
 
 def validate_full_path(path: list) -> bool:
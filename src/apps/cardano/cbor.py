@@ -2,12 +2,13 @@
 Minimalistic CBOR implementation, supports only what we need in cardano.
 """
 
-import ustruct as struct
 from micropython import const
 
 from trezor import log
 from trezor.utils import ensure
 
+from apps.common.writers import empty_bytearray
+
 _CBOR_TYPE_MASK = const(0xE0)
 _CBOR_INFO_BITS = const(0x1F)
 
@@ -28,130 +29,202 @@ _CBOR_BREAK = const(0x1F)
 _CBOR_RAW_TAG = const(0x18)
 
 
-def _header(typ, l: int):
+def _header_len(l: int) -> int:
     if l < 24:
-        return struct.pack(">B", typ + l)
+        return 1
     elif l < 2 ** 8:
-        return struct.pack(">BB", typ + 24, l)
+        return 2
     elif l < 2 ** 16:
-        return struct.pack(">BH", typ + 25, l)
+        return 3
     elif l < 2 ** 32:
-        return struct.pack(">BI", typ + 26, l)
+        return 5
     elif l < 2 ** 64:
-        return struct.pack(">BQ", typ + 27, l)
+        return 9
     else:
         raise NotImplementedError("Length %d not suppported" % l)
 
 
-def _cbor_encode(value):
+def _write_header(w, typ: int, l: int):
+    if l < 24:
+        w.append(typ + l)
+        return
+    elif l < 2 ** 8:
+        w.append(typ + _CBOR_UINT8_FOLLOWS)
+        n = 1
+    elif l < 2 ** 16:
+        w.append(typ + _CBOR_UINT16_FOLLOWS)
+        n = 2
+    elif l < 2 ** 32:
+        w.append(typ + _CBOR_UINT32_FOLLOWS)
+        n = 4
+    elif l < 2 ** 64:
+        w.append(typ + _CBOR_UINT64_FOLLOWS)
+        n = 8
+    else:
+        raise NotImplementedError("Length %d not suppported" % l)
+    for shift in range(8 * (n - 1), -1, -8):
+        w.append((l >> shift) & 0xFF)
+
+
+def encoded_len(value) -> int:
+    """
+    Returns the length of `encode(value)` without encoding anything.
+    """
     if isinstance(value, int):
-        yield _header(_CBOR_UNSIGNED_INT, value)
-    elif isinstance(value, bytes):
-        yield _header(_CBOR_BYTE_STRING, len(value))
-        yield value
-    elif isinstance(value, bytearray):
-        yield _header(_CBOR_BYTE_STRING, len(value))
-        yield bytes(value)
+        return _header_len(value)
+    elif isinstance(value, (bytes, bytearray)):
+        return _header_len(len(value)) + len(value)
+    elif isinstance(value, list):
+        res = _header_len(len(value))
+        for x in value:
+            res += encoded_len(x)
+        return res
+    elif isinstance(value, dict):
+        res = _header_len(len(value))
+        for k, v in value.items():
+            res += encoded_len(k) + encoded_len(v)
+        return res
+    elif isinstance(value, Tagged):
+        return _header_len(value.tag) + encoded_len(value.value)
+    elif isinstance(value, EncodedCbor):
+        ln = encoded_len(value.value)
+        return _header_len(_CBOR_RAW_TAG) + _header_len(ln) + ln
+    elif isinstance(value, IndefiniteLengthArray):
+        res = 2
+        for x in value.array:
+            res += encoded_len(x)
+        return res
+    elif isinstance(value, Raw):
+        return len(value.value)
+    else:
+        raise NotImplementedError()
+
+
+def encode_into(w, value):
+    """
+    Writes the encoding of `value` into `w`, which is either a bytearray or
+    any writer with `append()` and `extend()`, e.g. `trezor.utils.HashWriter`.
+    """
+    if isinstance(value, int):
+        _write_header(w, _CBOR_UNSIGNED_INT, value)
+    elif isinstance(value, (bytes, bytearray)):
+        _write_header(w, _CBOR_BYTE_STRING, len(value))
+        w.extend(value)
     elif isinstance(value, list):
         # definite-length valued list
-        yield _header(_CBOR_ARRAY, len(value))
+        _write_header(w, _CBOR_ARRAY, len(value))
         for x in value:
-            yield from _cbor_encode(x)
+            encode_into(w, x)
     elif isinstance(value, dict):
-        yield _header(_CBOR_MAP, len(value))
+        _write_header(w, _CBOR_MAP, len(value))
         for k, v in value.items():
-            yield from _cbor_encode(k)
-            yield from _cbor_encode(v)
+            encode_into(w, k)
+            encode_into(w, v)
     elif isinstance(value, Tagged):
-        yield _header(_CBOR_TAG, value.tag)
-        yield from _cbor_encode(value.value)
+        _write_header(w, _CBOR_TAG, value.tag)
+        encode_into(w, value.value)
+    elif isinstance(value, EncodedCbor):
+        _write_header(w, _CBOR_TAG, _CBOR_RAW_TAG)
+        _write_header(w, _CBOR_BYTE_STRING, encoded_len(value.value))
+        encode_into(w, value.value)
     elif isinstance(value, IndefiniteLengthArray):
-        yield bytes([_CBOR_ARRAY + 31])
+        w.append(_CBOR_ARRAY + _CBOR_VAR_FOLLOWS)
         for x in value.array:
-            yield from _cbor_encode(x)
-        yield bytes([_CBOR_PRIMITIVE + 31])
+            encode_into(w, x)
+        w.append(_CBOR_PRIMITIVE + _CBOR_BREAK)
     elif isinstance(value, Raw):
-        yield value.value
+        w.extend(value.value)
     else:
         if __debug__:
             log.debug(__name__, "not implemented (encode): %s", type(value))
         raise NotImplementedError()
 
 
-def _read_length(cbor, aux):
-    if aux == _CBOR_UINT8_FOLLOWS:
-        return (cbor[0], cbor[1:])
-    elif aux == _CBOR_UINT16_FOLLOWS:
-        res = cbor[1]
-        res += cbor[0] << 8
-        return (res, cbor[2:])
-    elif aux == _CBOR_UINT32_FOLLOWS:
-        res = cbor[3]
-        res += cbor[2] << 8
-        res += cbor[1] << 16
-        res += cbor[0] << 24
-        return (res, cbor[4:])
-    elif aux == _CBOR_UINT64_FOLLOWS:
-        res = cbor[7]
-        res += cbor[6] << 8
-        res += cbor[5] << 16
-        res += cbor[4] << 24
-        res += cbor[3] << 32
-        res += cbor[2] << 40
-        res += cbor[1] << 48
-        res += cbor[0] << 56
-        return (res, cbor[8:])
+def _read_length(cbor, pos: int, aux: int):
+    if aux < _CBOR_UINT8_FOLLOWS:
+        return (aux, pos)
+    elif aux <= _CBOR_UINT64_FOLLOWS:
+        end = pos + (1 << (aux - _CBOR_UINT8_FOLLOWS))  # 1, 2, 4 or 8 bytes
+        res = 0
+        while pos < end:
+            res = (res << 8) | cbor[pos]
+            pos += 1
+        return (res, pos)
     else:
         raise NotImplementedError("Length %d not suppported" % aux)
 
 
-def _cbor_decode(cbor):
-    fb = cbor[0]
-    data = b""
+def _cbor_decode(cbor, pos: int):
+    fb = cbor[pos]
+    pos += 1
     fb_type = fb & _CBOR_TYPE_MASK
     fb_aux = fb & _CBOR_INFO_BITS
     if fb_type == _CBOR_UNSIGNED_INT:
-        if fb_aux < 0x18:
-            return (fb_aux, cbor[1:])
-        else:
-            val, data = _read_length(cbor[1:], fb_aux)
-            return (int(val), data)
+        return _read_length(cbor, pos, fb_aux)
     elif fb_type == _CBOR_BYTE_STRING:
-        ln, data = _read_length(cbor[1:], fb_aux)
-        return (data[0:ln], data[ln:])
+        ln, pos = _read_length(cbor, pos, fb_aux)
+        return (bytes(cbor[pos : pos + ln]), pos + ln)
     elif fb_type == _CBOR_ARRAY:
+        res = []
         if fb_aux == _CBOR_VAR_FOLLOWS:
-            res = []
-            data = cbor[1:]
-            while True:
-                item, data = _cbor_decode(data)
-                if item == _CBOR_PRIMITIVE + _CBOR_BREAK:
-                    break
+            while cbor[pos] != _CBOR_PRIMITIVE + _CBOR_BREAK:
+                item, pos = _cbor_decode(cbor, pos)
                 res.append(item)
-            return (res, data)
+            return (res, pos + 1)
         else:
-            if fb_aux < _CBOR_UINT8_FOLLOWS:
-                ln = fb_aux
-                data = cbor[1:]
-            else:
-                ln, data = _read_length(cbor[1:], fb_aux)
-            res = []
+            ln, pos = _read_length(cbor, pos, fb_aux)
             for i in range(ln):
-                item, data = _cbor_decode(data)
+                item, pos = _cbor_decode(cbor, pos)
                 res.append(item)
-            return (res, data)
+            return (res, pos)
     elif fb_type == _CBOR_MAP:
-        return ({}, cbor[1:])
+        res = {}
+        ln, pos = _read_length(cbor, pos, fb_aux)
+        for i in range(ln):
+            key, pos = _cbor_decode(cbor, pos)
+            res[key], pos = _cbor_decode(cbor, pos)
+        return (res, pos)
     elif fb_type == _CBOR_TAG:
-        if cbor[1] == _CBOR_RAW_TAG:  # only tag 24 (0x18) is supported
-            return _cbor_decode(cbor[2:])
+        tag, pos = _read_length(cbor, pos, fb_aux)
+        if tag == _CBOR_RAW_TAG:  # only tag 24 (0x18) is supported
+            return _cbor_decode(cbor, pos)
         else:
             raise NotImplementedError()
     elif fb_type == _CBOR_PRIMITIVE:  # only break code is supported
-        return (cbor[0], cbor[1:])
+        return (fb, pos)
     else:
         if __debug__:
-            log.debug(__name__, "not implemented (decode): %s", cbor[0])
+            log.debug(__name__, "not implemented (decode): %s", fb)
+        raise NotImplementedError()
+
+
+def _cbor_skip(cbor, pos: int) -> int:
+    fb = cbor[pos]
+    pos += 1
+    fb_type = fb & _CBOR_TYPE_MASK
+    fb_aux = fb & _CBOR_INFO_BITS
+    if fb_type == _CBOR_PRIMITIVE:
+        return pos
+    if fb_aux == _CBOR_VAR_FOLLOWS and fb_type in (_CBOR_ARRAY, _CBOR_MAP):
+        while cbor[pos] != _CBOR_PRIMITIVE + _CBOR_BREAK:
+            pos = _cbor_skip(cbor, pos)
+        return pos + 1
+    val, pos = _read_length(cbor, pos, fb_aux)
+    if fb_type == _CBOR_UNSIGNED_INT:
+        return pos
+    elif fb_type == _CBOR_BYTE_STRING:
+        return pos + val
+    elif fb_type == _CBOR_ARRAY:
+        for i in range(val):
+            pos = _cbor_skip(cbor, pos)
+        return pos
+    elif fb_type == _CBOR_MAP:
+        for i in range(val * 2):
+            pos = _cbor_skip(cbor, pos)
+        return pos
+    elif fb_type == _CBOR_TAG:
+        return _cbor_skip(cbor, pos)
+    else:
         raise NotImplementedError()
 
 
@@ -161,6 +234,16 @@ class Tagged:
         self.value = value
 
 
+class EncodedCbor:
+    """
+    Tag 24 wrapping the encoding of `value`, i.e. `Tagged(24, encode(value))`
+    without the intermediate copy.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+
 class Raw:
     def __init__(self, value):
         self.value = value
@@ -172,12 +255,43 @@ class IndefiniteLengthArray:
         self.array = array
 
 
-def encode(value):
-    return b"".join(_cbor_encode(value))
+def encode(value) -> bytes:
+    w = empty_bytearray(encoded_len(value))
+    encode_into(w, value)
+    return bytes(w)
 
 
 def decode(cbor: bytes):
-    res, check = _cbor_decode(cbor)
-    if not (check == b""):
+    res, pos = _cbor_decode(cbor, 0)
+    if pos != len(cbor):
         raise ValueError()
     return res
+
+
+def decode_path(cbor: bytes, path: tuple):
+    """
+    Decodes only the item found by following `path`, a sequence of array
+    indices, from the top-level item, e.g. `decode_path(cbor, (1, 0))` is
+    `decode(cbor)[1][0]`.  Items before the wanted one are skipped without
+    being decoded.
+    """
+    pos = 0
+    for index in path:
+        fb = cbor[pos]
+        if fb & _CBOR_TYPE_MASK != _CBOR_ARRAY:
+            raise ValueError()
+        pos += 1
+        if fb & _CBOR_INFO_BITS == _CBOR_VAR_FOLLOWS:
+            for i in range(index):
+                if cbor[pos] == _CBOR_PRIMITIVE + _CBOR_BREAK:
+                    raise IndexError()
+                pos = _cbor_skip(cbor, pos)
+            if cbor[pos] == _CBOR_PRIMITIVE + _CBOR_BREAK:
+                raise IndexError()
+        else:
+            ln, pos = _read_length(cbor, pos, fb & _CBOR_INFO_BITS)
+            if index >= ln:
+                raise IndexError()
+            for i in range(index):
+                pos = _cbor_skip(cbor, pos)
+    return _cbor_decode(cbor, pos)[0]
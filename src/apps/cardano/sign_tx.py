@@ -16,6 +16,7 @@ from apps.cardano.address import (
 from apps.cardano.layout import confirm_sending, confirm_transaction, progress
 from apps.common.paths import validate_path
 from apps.common.seed import remove_ed25519_prefix
+from apps.common.writers import empty_bytearray
 from apps.homescreen.homescreen import display_homescreen
 
 # the maximum allowed change address.  this should be large enough for normal
@@ -67,19 +68,33 @@ async def request_transaction(ctx, tx_req: CardanoTxRequest, index: int):
     return await ctx.call(tx_req, CardanoTxAck)
 
 
+def process_transaction(raw_transaction, inputs: list, input_coins: list):
+    """
+    Fills in `input_coins` for the inputs spending outputs of `raw_transaction`.
+    """
+    tx_hash = hashlib.blake2b(data=raw_transaction, outlen=32).digest()
+    for index, input in enumerate(inputs):
+        if input_coins[index] is None and bytes(input.prev_hash) == tx_hash:
+            # amount of prev_index-th output of the transaction
+            input_coins[index] = cbor.decode_path(
+                raw_transaction, (1, input.prev_index, 1)
+            )
+
+
 async def sign_tx(ctx, msg):
     keychain = await seed.get_keychain(ctx)
 
     progress.init(msg.transactions_count, "Loading data")
 
     try:
-        # request transactions
-        transactions = []
+        # request transactions one by one, keeping only the spent amounts
+        input_coins = [None] * len(msg.inputs)
         tx_req = CardanoTxRequest()
         for index in range(msg.transactions_count):
             progress.advance()
             tx_ack = await request_transaction(ctx, tx_req, index)
-            transactions.append(tx_ack.transaction)
+            process_transaction(tx_ack.transaction, msg.inputs, input_coins)
+            tx_ack = None
 
         # clear progress bar
         display_homescreen()
@@ -89,7 +104,7 @@ async def sign_tx(ctx, msg):
 
         # sign the transaction bundle and prepare the result
         transaction = Transaction(
-            msg.inputs, msg.outputs, transactions, keychain, msg.protocol_magic
+            msg.inputs, msg.outputs, input_coins, keychain, msg.protocol_magic
         )
         tx_body, tx_hash = transaction.serialise_tx()
         tx = CardanoSignedTx(tx_body=tx_body, tx_hash=tx_hash)
@@ -119,13 +134,13 @@ class Transaction:
         self,
         inputs: list,
         outputs: list,
-        transactions: list,
+        input_coins: list,
         keychain,
         protocol_magic: int,
     ):
         self.inputs = inputs
         self.outputs = outputs
-        self.transactions = transactions
+        self.input_coins = input_coins
         self.keychain = keychain
         # attributes have to be always empty in current Cardano
         self.attributes = {}
@@ -134,17 +149,14 @@ class Transaction:
         self.protocol_magic = protocol_magic
 
     def _process_inputs(self):
-        input_coins = []
         input_hashes = []
         output_indexes = []
         types = []
-        tx_data = {}
 
-        for raw_transaction in self.transactions:
-            tx_hash = hashlib.blake2b(data=bytes(raw_transaction), outlen=32).digest()
-            tx_data[tx_hash] = cbor.decode(raw_transaction)
+        for index, input in enumerate(self.inputs):
+            if self.input_coins[index] is None:
+                raise wire.ProcessError("No tx data sent for input " + str(index))
 
-        for input in self.inputs:
             input_hashes.append(input.prev_hash)
             output_indexes.append(input.prev_index)
             types.append(input.type or 0)
@@ -154,17 +166,6 @@ class Transaction:
             _, node = derive_address_and_node(self.keychain, input.address_n)
             nodes.append(node)
 
-        for index, output_index in enumerate(output_indexes):
-            tx_hash = bytes(input_hashes[index])
-            if tx_hash in tx_data:
-                tx = tx_data[tx_hash]
-                outputs = tx[1]
-                amount = outputs[output_index][1]
-                input_coins.append(amount)
-            else:
-                raise wire.ProcessError("No tx data sent for input " + str(index))
-
-        self.input_coins = input_coins
         self.nodes = nodes
         self.types = types
         self.input_hashes = input_hashes
@@ -213,10 +214,7 @@ class Transaction:
                 remove_ed25519_prefix(node.public_key()) + node.chain_code()
             )
             witnesses.append(
-                [
-                    self.types[index],
-                    cbor.Tagged(24, cbor.encode([extended_public_key, signature])),
-                ]
+                [self.types[index], cbor.EncodedCbor([extended_public_key, signature])]
             )
 
         return witnesses
@@ -237,10 +235,7 @@ class Transaction:
         inputs_cbor = []
         for i, output_index in enumerate(self.output_indexes):
             inputs_cbor.append(
-                [
-                    self.types[i],
-                    cbor.Tagged(24, cbor.encode([self.input_hashes[i], output_index])),
-                ]
+                [self.types[i], cbor.EncodedCbor([self.input_hashes[i], output_index])]
             )
 
         inputs_cbor = cbor.IndefiniteLengthArray(inputs_cbor)
@@ -259,10 +254,16 @@ class Transaction:
         outputs_cbor = cbor.IndefiniteLengthArray(outputs_cbor)
 
         tx_aux_cbor = [inputs_cbor, outputs_cbor, self.attributes]
-        tx_hash = hashlib.blake2b(data=cbor.encode(tx_aux_cbor), outlen=32).digest()
+
+        # tx_body is [tx_aux, witnesses], tx_aux is encoded only once right
+        # into it and hashed in place, i.e. without the one-byte header
+        tx_body = empty_bytearray(1 + cbor.encoded_len(tx_aux_cbor))
+        tx_body.append(0x82)  # CBOR header of a two-item array
+        cbor.encode_into(tx_body, tx_aux_cbor)
+        tx_hash = hashlib.blake2b(data=memoryview(tx_body)[1:], outlen=32).digest()
 
         witnesses = self._build_witnesses(tx_hash)
-        tx_body = cbor.encode([tx_aux_cbor, witnesses])
+        cbor.encode_into(tx_body, witnesses)
 
         self.fee = self.compute_fee(
             self.input_coins, self.outgoing_coins, self.change_coins
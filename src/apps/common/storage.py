@@ -34,24 +34,52 @@ _MNEMONIC_TYPE      = const(0x0E)  # int
 _ROTATION           = const(0x0F)  # int
 # fmt: on
 
+# Read-through cache of the values above, keyed by _cache_key().  Values
+# are kept as returned by config.get, the homescreen and the mnemonic secret
+# are never cached.  The cache is dropped whenever the storage gets unlocked
+# or wiped.  The storage is locked again only by a reboot, which drops the
+# cache as well; code locking it at runtime has to clear the cache too.
+_cache = {}
+
+
+def _cache_key(app: int, key: int, public: bool) -> int:
+    return (app << 8) | key | (0x10000 if public else 0)
+
+
+def _get(app: int, key: int, public: bool = False) -> bytes:
+    k = _cache_key(app, key, public)
+    if k in _cache:
+        return _cache[k]
+    val = config.get(app, key, public)
+    _cache[k] = val
+    return val
+
+
+def _set(app: int, key: int, value: bytes, public: bool = False) -> None:
+    if _get(app, key, public) == value:
+        return  # spare the flash a write of the same value
+    config.set(app, key, value, public)
+    _cache[_cache_key(app, key, public)] = value
+
 
 def _set_bool(app: int, key: int, value: bool, public: bool = False) -> None:
     if value:
-        config.set(app, key, _TRUE_BYTE, public)
-    else:
-        config.set(app, key, _FALSE_BYTE, public)
+        _set(app, key, _TRUE_BYTE, public)
+    elif _get_bool(app, key, public):
+        # unset value reads as False as well
+        _set(app, key, _FALSE_BYTE, public)
 
 
 def _get_bool(app: int, key: int, public: bool = False) -> bool:
-    return config.get(app, key, public) == _TRUE_BYTE
+    return _get(app, key, public) == _TRUE_BYTE
 
 
 def _set_uint8(app: int, key: int, val: int):
-    config.set(app, key, val.to_bytes(1, "big"))
+    _set(app, key, val.to_bytes(1, "big"))
 
 
 def _get_uint8(app: int, key: int) -> int:
-    val = config.get(app, key)
+    val = _get(app, key)
     if not val:
         return None
     return int.from_bytes(val, "big")
@@ -62,26 +90,26 @@ def _new_device_id() -> str:
 
 
 def get_device_id() -> str:
-    dev_id = config.get(_APP, _DEVICE_ID, True)  # public
+    dev_id = _get(_APP, _DEVICE_ID, True)  # public
     if not dev_id:
         dev_id = _new_device_id().encode()
-        config.set(_APP, _DEVICE_ID, dev_id, True)  # public
+        _set(_APP, _DEVICE_ID, dev_id, True)  # public
     return dev_id.decode()
 
 
 def get_rotation() -> int:
-    rotation = config.get(_APP, _ROTATION, True)  # public
+    rotation = _get(_APP, _ROTATION, True)  # public
     if not rotation:
         return 0
     return int.from_bytes(rotation, "big")
 
 
 def is_initialized() -> bool:
-    return bool(config.get(_APP, _VERSION))
+    return bool(_get(_APP, _VERSION))
 
 
 def get_label() -> str:
-    label = config.get(_APP, _LABEL, True)  # public
+    label = _get(_APP, _LABEL, True)  # public
     if label is None:
         return None
     return label.decode()
@@ -111,7 +139,7 @@ def store_mnemonic(
 ) -> None:
     config.set(_APP, _MNEMONIC_SECRET, secret)
     _set_uint8(_APP, _MNEMONIC_TYPE, mnemonic_type)
-    config.set(_APP, _VERSION, _STORAGE_VERSION)
+    _set(_APP, _VERSION, _STORAGE_VERSION)
     _set_bool(_APP, _NO_BACKUP, no_backup)
     if not no_backup:
         _set_bool(_APP, _NEEDS_BACKUP, needs_backup)
@@ -122,7 +150,7 @@ def needs_backup() -> bool:
 
 
 def set_backed_up() -> None:
-    config.set(_APP, _NEEDS_BACKUP, b"")
+    _set(_APP, _NEEDS_BACKUP, b"")
 
 
 def unfinished_backup() -> bool:
@@ -138,7 +166,7 @@ def no_backup() -> bool:
 
 
 def get_passphrase_source() -> int:
-    b = config.get(_APP, _PASSPHRASE_SOURCE)
+    b = _get(_APP, _PASSPHRASE_SOURCE)
     if b == b"\x01":
         return 1
     elif b == b"\x02":
@@ -155,7 +183,7 @@ def load_settings(
     display_rotation: int = None,
 ) -> None:
     if label is not None:
-        config.set(_APP, _LABEL, label.encode(), True)  # public
+        _set(_APP, _LABEL, label.encode(), True)  # public
     if use_passphrase is not None:
         _set_bool(_APP, _USE_PASSPHRASE, use_passphrase)
     if homescreen is not None:
@@ -166,20 +194,18 @@ def load_settings(
             config.set(_APP, _HOMESCREEN, b"", True)  # public
     if passphrase_source is not None:
         if passphrase_source in (0, 1, 2):
-            config.set(_APP, _PASSPHRASE_SOURCE, bytes([passphrase_source]))
+            _set(_APP, _PASSPHRASE_SOURCE, bytes([passphrase_source]))
     if display_rotation is not None:
         if display_rotation not in (0, 90, 180, 270):
             raise ValueError(
                 "Unsupported display rotation degrees: %d" % display_rotation
             )
         else:
-            config.set(
-                _APP, _ROTATION, display_rotation.to_bytes(2, "big"), True
-            )  # public
+            _set(_APP, _ROTATION, display_rotation.to_bytes(2, "big"), True)  # public
 
 
 def get_flags() -> int:
-    b = config.get(_APP, _FLAGS)
+    b = _get(_APP, _FLAGS)
     if b is None:
         return 0
     else:
@@ -187,18 +213,18 @@ def get_flags() -> int:
 
 
 def set_flags(flags: int) -> None:
-    b = config.get(_APP, _FLAGS)
+    b = _get(_APP, _FLAGS)
     if b is None:
         b = 0
     else:
         b = int.from_bytes(b, "big")
     flags = (flags | b) & 0xFFFFFFFF
     if flags != b:
-        config.set(_APP, _FLAGS, flags.to_bytes(4, "big"))
+        _set(_APP, _FLAGS, flags.to_bytes(4, "big"))
 
 
 def get_autolock_delay_ms() -> int:
-    b = config.get(_APP, _AUTOLOCK_DELAY_MS)
+    b = _get(_APP, _AUTOLOCK_DELAY_MS)
     if b is None:
         return 10 * 60 * 1000
     else:
@@ -208,7 +234,7 @@ def get_autolock_delay_ms() -> int:
 def set_autolock_delay_ms(delay_ms: int) -> None:
     if delay_ms < 60 * 1000:
         delay_ms = 60 * 1000
-    config.set(_APP, _AUTOLOCK_DELAY_MS, delay_ms.to_bytes(4, "big"))
+    _set(_APP, _AUTOLOCK_DELAY_MS, delay_ms.to_bytes(4, "big"))
 
 
 def next_u2f_counter() -> int:
@@ -221,12 +247,16 @@ def set_u2f_counter(cntr: int) -> None:
 
 def wipe():
     config.wipe()
+    _cache.clear()
     cache.clear()
 
 
 def init_unlocked():
+    # Drop values read while the storage was locked.
+    _cache.clear()
+
     # Check for storage version upgrade.
-    version = config.get(_APP, _VERSION)
+    version = _get(_APP, _VERSION)
     if version == b"\x01":
         # Make the U2F counter public and writable even when storage is locked.
         counter = config.get(_APP, _U2F_COUNTER)
@@ -235,4 +265,4 @@ def init_unlocked():
                 _APP, _U2F_COUNTER, int.from_bytes(counter, "big"), True
             )  # writable when locked
             config.delete(_APP, _U2F_COUNTER)
-        config.set(_APP, _VERSION, _STORAGE_VERSION)
+        _set(_APP, _VERSION, _STORAGE_VERSION)
@@ -0,0 +1,39 @@
+from micropython import const
+
+_ADDRESS = const(0)
+_UINT256 = const(1)
+
+# ERC-20 calls recognized in the transaction data, indexed by the function
+# selector, i.e. the first four bytes of keccak256 of the function signature
+_ERC20_CALLS = {
+    b"\xa9\x05\x9c\xbb": ("transfer", (_ADDRESS, _UINT256)),
+    b"\x09\x5e\xa7\xb3": ("approve", (_ADDRESS, _UINT256)),
+    b"\x23\xb8\x72\xdd": ("transferFrom", (_ADDRESS, _ADDRESS, _UINT256)),
+}
+
+_ADDRESS_PADDING = bytes(12)
+
+
+def decode_erc20_call(data: bytes):
+    """
+    Decodes a call of an ERC-20 function from the transaction data.  Returns
+    a `(name, args)` tuple, or None if the selector is not known or the
+    arguments are not well-formed.
+    """
+    call = _ERC20_CALLS.get(bytes(data[:4]))
+    if call is None:
+        return None
+    name, layout = call
+    if len(data) != 4 + 32 * len(layout):
+        return None
+    args = []
+    offset = 4
+    for typ in layout:
+        if typ == _ADDRESS:
+            if data[offset : offset + 12] != _ADDRESS_PADDING:
+                return None
+            args.append(bytes(data[offset + 12 : offset + 32]))
+        else:
+            args.append(int.from_bytes(data[offset : offset + 32], "big"))
+        offset += 32
+    return (name, args)
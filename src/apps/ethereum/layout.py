@@ -26,6 +26,27 @@ async def require_confirm_tx(ctx, to_bytes, value, chain_id, token=None, tx_type
     await require_confirm(ctx, text, ButtonRequestType.SignTx)
 
 
+async def require_confirm_approve(ctx, spender_bytes, value, chain_id, token):
+    spender_str = address_from_bytes(spender_bytes, networks.by_chain_id(chain_id))
+    text = Text("Confirm approval", ui.ICON_SEND, icon_color=ui.GREEN, new_lines=False)
+    text.normal("Allow spending")
+    text.br()
+    text.bold(format_ethereum_amount(value, token, chain_id))
+    text.normal(ui.GREY, "by", ui.FG)
+    for spender_line in split_address(spender_str):
+        text.br()
+        text.mono(spender_line)
+    await require_confirm(ctx, text, ButtonRequestType.SignTx)
+
+
+async def require_confirm_sender(ctx, sender_bytes, chain_id):
+    sender_str = address_from_bytes(sender_bytes, networks.by_chain_id(chain_id))
+    text = Text("Confirm sending", ui.ICON_SEND, icon_color=ui.GREEN)
+    text.normal(ui.GREY, "from", ui.FG)
+    text.mono(*split_address(sender_str))
+    await require_confirm(ctx, text, ButtonRequestType.SignTx)
+
+
 async def require_confirm_fee(
     ctx, spending, gas_price, gas_limit, chain_id, token=None, tx_type=None
 ):
@@ -55,6 +76,14 @@ async def require_confirm_data(ctx, data, data_total):
     await require_confirm(ctx, text, ButtonRequestType.SignTx)
 
 
+def show_data_progress(data_left: int, data_total: int):
+    if data_left == data_total:
+        ui.display.clear()
+        ui.header("Loading data")
+    p = int(1000 * (data_total - data_left) / data_total)
+    ui.display.loader(p, 18, ui.WHITE, ui.BG)
+
+
 def format_ethereum_amount(value: int, token, chain_id: int, tx_type=None):
     if token:
         if token is tokens.UNKNOWN_TOKEN:
@@ -1,3 +1,6 @@
+import gc
+from micropython import const
+
 from trezor import wire
 from trezor.crypto import rlp
 from trezor.crypto.curve import secp256k1
@@ -8,17 +11,25 @@ from trezor.messages.MessageType import EthereumTxAck
 from trezor.utils import HashWriter
 
 from apps.common import paths
-from apps.ethereum import CURVE, address, tokens
+from apps.ethereum import CURVE, abi, address, tokens
 from apps.ethereum.address import validate_full_path
 from apps.ethereum.layout import (
+    require_confirm_approve,
     require_confirm_data,
     require_confirm_fee,
+    require_confirm_sender,
     require_confirm_tx,
+    show_data_progress,
 )
 
 # maximum supported chain id
 MAX_CHAIN_ID = 2147483629
 
+# bounds of the size of data chunks requested from the host, bigger chunks
+# need fewer round-trips but each of them has to fit into the free heap
+_MIN_CHUNK_SIZE = const(1024)
+_MAX_CHUNK_SIZE = const(16 * 1024)
+
 
 async def sign_tx(ctx, msg, keychain):
     msg = sanitize(msg)
@@ -29,23 +40,39 @@ async def sign_tx(ctx, msg, keychain):
 
     # detect ERC - 20 token
     token = None
+    call = None
     address_bytes = recipient = address.bytes_from_address(msg.to)
     value = int.from_bytes(msg.value, "big")
     if (
         len(msg.to) in (40, 42)
         and len(msg.value) == 0
-        and data_total == 68
-        and len(msg.data_initial_chunk) == 68
-        and msg.data_initial_chunk[:16]
-        == b"\xa9\x05\x9c\xbb\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        and data_total == len(msg.data_initial_chunk)
     ):
-        token = tokens.token_by_chain_address(msg.chain_id, address_bytes)
-        recipient = msg.data_initial_chunk[16:36]
-        value = int.from_bytes(msg.data_initial_chunk[36:68], "big")
+        call = abi.decode_erc20_call(msg.data_initial_chunk)
 
-    await require_confirm_tx(ctx, recipient, value, msg.chain_id, token, msg.tx_type)
-    if token is None and msg.data_length > 0:
-        await require_confirm_data(ctx, msg.data_initial_chunk, data_total)
+    if call is None:
+        await require_confirm_tx(ctx, recipient, value, msg.chain_id, None, msg.tx_type)
+        if msg.data_length > 0:
+            await require_confirm_data(ctx, msg.data_initial_chunk, data_total)
+    else:
+        token = tokens.token_by_chain_address(msg.chain_id, address_bytes)
+        name, args = call
+        if name == "approve":
+            spender, allowance = args
+            await require_confirm_approve(ctx, spender, allowance, msg.chain_id, token)
+            # an approval moves no tokens, so the fee screen shows the ETH value
+            token = None
+        elif name == "transferFrom":
+            sender, recipient, value = args
+            await require_confirm_tx(
+                ctx, recipient, value, msg.chain_id, token, msg.tx_type
+            )
+            await require_confirm_sender(ctx, sender, msg.chain_id)
+        else:
+            recipient, value = args
+            await require_confirm_tx(
+                ctx, recipient, value, msg.chain_id, token, msg.tx_type
+            )
 
     await require_confirm_fee(
         ctx,
@@ -57,37 +84,41 @@ async def sign_tx(ctx, msg, keychain):
         msg.tx_type,
     )
 
-    data = bytearray()
-    data += msg.data_initial_chunk
+    data = msg.data_initial_chunk
     data_left = data_total - len(msg.data_initial_chunk)
 
     total_length = get_total_length(msg, data_total)
 
     sha = HashWriter(sha3_256(keccak=True))
-    sha.extend(rlp.encode_length(total_length, True))  # total length
+    rlp.write_length(sha, total_length, True)  # total length
 
     if msg.tx_type is not None:
-        sha.extend(rlp.encode(msg.tx_type))
+        rlp.write(sha, msg.tx_type)
 
     for field in (msg.nonce, msg.gas_price, msg.gas_limit, address_bytes, msg.value):
-        sha.extend(rlp.encode(field))
+        rlp.write(sha, field)
 
     if data_left == 0:
-        sha.extend(rlp.encode(data))
+        rlp.write(sha, data)
     else:
-        sha.extend(rlp.encode_length(data_total, False))
-        sha.extend(rlp.encode(data, False))
-
-    while data_left > 0:
-        resp = await send_request_chunk(ctx, data_left)
-        data_left -= len(resp.data_chunk)
-        sha.extend(resp.data_chunk)
+        rlp.write_length(sha, data_total, False)
+        rlp.write(sha, data, False)
+
+    if data_left > 0:
+        chunk_size = get_chunk_size()
+        data_streamed_total = data_left
+        while data_left > 0:
+            show_data_progress(data_left, data_streamed_total)
+            resp = await send_request_chunk(ctx, data_left, chunk_size)
+            data_left -= len(resp.data_chunk)
+            sha.extend(resp.data_chunk)
+            resp = None  # free the chunk before requesting the next one
 
     # eip 155 replay protection
     if msg.chain_id:
-        sha.extend(rlp.encode(msg.chain_id))
-        sha.extend(rlp.encode(0))
-        sha.extend(rlp.encode(0))
+        rlp.write(sha, msg.chain_id)
+        rlp.write(sha, 0)
+        rlp.write(sha, 0)
 
     digest = sha.get_digest()
     result = sign_digest(msg, keychain, digest)
@@ -124,13 +155,19 @@ def get_total_length(msg: EthereumSignTx, data_total: int) -> int:
     return length
 
 
-async def send_request_chunk(ctx, data_left: int):
-    # TODO: layoutProgress ?
+def get_chunk_size() -> int:
+    # the decoded chunk is allocated while the previous one can still be
+    # waiting for collection, so leave plenty of heap to the rest
+    gc.collect()
+    return max(_MIN_CHUNK_SIZE, min(_MAX_CHUNK_SIZE, gc.mem_free() // 8))
+
+
+async def send_request_chunk(ctx, data_left: int, chunk_size: int = _MIN_CHUNK_SIZE):
     req = EthereumTxRequest()
-    if data_left <= 1024:
+    if data_left <= chunk_size:
         req.data_length = data_left
     else:
-        req.data_length = 1024
+        req.data_length = chunk_size
 
     return await ctx.call(req, EthereumTxAck)
 
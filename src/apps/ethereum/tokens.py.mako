@@ -3,9 +3,19 @@
 
 
 def token_by_chain_address(chain_id, address):
-    for token in tokens:
-        if chain_id == token[0] and address == token[1]:
-            return token
+    address = bytes(address)
+    # tokens are sorted by chain id and address, look up the first match
+    lo = 0
+    hi = len(tokens)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        token = tokens[mid]
+        if token[0] < chain_id or (token[0] == chain_id and token[1] < address):
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo < len(tokens) and tokens[lo][0] == chain_id and tokens[lo][1] == address:
+        return tokens[lo]
     return UNKNOWN_TOKEN
 
 
@@ -14,7 +24,7 @@ UNKNOWN_TOKEN = (None, None, None, None)
 
 # fmt: off
 tokens = [
-% for t in supported_on("trezor2", erc20):
+% for t in sorted(supported_on("trezor2", erc20), key=lambda t: (t.chain_id, t.address_bytes)):
     (${t.chain_id}, ${black_repr(t.address_bytes)}, ${black_repr(t.symbol)}, ${t.decimals}),  # ${t.chain} / ${t.name.strip()}
 % endfor
 ]
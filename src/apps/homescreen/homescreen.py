@@ -1,4 +1,4 @@
-from trezor import config, io, loop, res, ui
+from trezor import config, io, loop, profiler, res, ui
 
 from apps.common import storage
 
@@ -6,7 +6,9 @@ from apps.common import storage
 async def homescreen():
     # render homescreen in dimmed mode and fade back in
     await ui.backlight_slide(ui.BACKLIGHT_DIM)
-    display_homescreen()
+    with profiler.phase("homescreen"):
+        display_homescreen()
+    profiler.dump()
     await ui.backlight_slide(ui.BACKLIGHT_NORMAL)
 
     # loop forever, never return
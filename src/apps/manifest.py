@@ -0,0 +1,133 @@
+# generated from manifest.py.mako
+# do not edit manually!
+"""
+Registers the wire workflows of the apps that are imported only after their
+first message arrives, so that booting does not import the app packages.
+"""
+
+from trezor import wire
+from trezor.messages import MessageType
+
+from apps.common import HARDENED
+
+
+def boot():
+    # apps.management
+    # only enable LoadDevice in debug builds
+    if __debug__:
+        wire.add(MessageType.LoadDevice, "apps.management", "load_device")
+    wire.add(MessageType.ResetDevice, "apps.management", "reset_device")
+    wire.add(MessageType.BackupDevice, "apps.management", "backup_device")
+    wire.add(MessageType.WipeDevice, "apps.management", "wipe_device")
+    wire.add(MessageType.RecoveryDevice, "apps.management", "recovery_device")
+    wire.add(MessageType.ApplySettings, "apps.management", "apply_settings")
+    wire.add(MessageType.ApplyFlags, "apps.management", "apply_flags")
+    wire.add(MessageType.ChangePin, "apps.management", "change_pin")
+    wire.add(MessageType.SetU2FCounter, "apps.management", "set_u2f_counter")
+
+    # apps.wallet
+    ns = [
+        ["curve25519"],
+        ["ed25519"],
+        ["ed25519-keccak"],
+        ["nist256p1"],
+        ["secp256k1"],
+        ["secp256k1-decred"],
+        ["secp256k1-groestl"],
+        ["secp256k1-smart"],
+    ]
+    wire.add(MessageType.GetPublicKey, "apps.wallet", "get_public_key", ns)
+    wire.add(MessageType.GetAddress, "apps.wallet", "get_address", ns)
+    wire.add(MessageType.GetEntropy, "apps.wallet", "get_entropy")
+    wire.add(MessageType.SignTx, "apps.wallet", "sign_tx", ns)
+    wire.add(MessageType.SignMessage, "apps.wallet", "sign_message", ns)
+    wire.add(MessageType.VerifyMessage, "apps.wallet", "verify_message")
+    wire.add(MessageType.SignIdentity, "apps.wallet", "sign_identity", ns)
+    wire.add(MessageType.GetECDHSessionKey, "apps.wallet", "get_ecdh_session_key", ns)
+    wire.add(MessageType.CipherKeyValue, "apps.wallet", "cipher_key_value", ns)
+
+    # apps.ethereum
+    # fmt: off
+    ns = [
+        ["secp256k1", HARDENED | 44, HARDENED | 1],
+        ["secp256k1", HARDENED | 44, HARDENED | 40],
+        ["secp256k1", HARDENED | 44, HARDENED | 60],
+        ["secp256k1", HARDENED | 44, HARDENED | 61],
+        ["secp256k1", HARDENED | 44, HARDENED | 76],
+        ["secp256k1", HARDENED | 44, HARDENED | 108],
+        ["secp256k1", HARDENED | 44, HARDENED | 137],
+        ["secp256k1", HARDENED | 44, HARDENED | 163],
+        ["secp256k1", HARDENED | 44, HARDENED | 164],
+        ["secp256k1", HARDENED | 44, HARDENED | 184],
+        ["secp256k1", HARDENED | 44, HARDENED | 237],
+        ["secp256k1", HARDENED | 44, HARDENED | 820],
+        ["secp256k1", HARDENED | 44, HARDENED | 1128],
+        ["secp256k1", HARDENED | 44, HARDENED | 1620],
+        ["secp256k1", HARDENED | 44, HARDENED | 1987],
+        ["secp256k1", HARDENED | 44, HARDENED | 2018],
+        ["secp256k1", HARDENED | 44, HARDENED | 2894],
+        ["secp256k1", HARDENED | 44, HARDENED | 6060],
+        ["secp256k1", HARDENED | 44, HARDENED | 31102],
+        ["secp256k1", HARDENED | 44, HARDENED | 37310],
+        ["secp256k1", HARDENED | 44, HARDENED | 200625],
+        ["secp256k1", HARDENED | 44, HARDENED | 246529],
+        ["secp256k1", HARDENED | 44, HARDENED | 1313114],
+    ]
+    # fmt: on
+    wire.add(MessageType.EthereumGetAddress, "apps.ethereum", "get_address", ns)
+    wire.add(MessageType.EthereumGetPublicKey, "apps.ethereum", "get_public_key", ns)
+    wire.add(MessageType.EthereumSignTx, "apps.ethereum", "sign_tx", ns)
+    wire.add(MessageType.EthereumSignMessage, "apps.ethereum", "sign_message", ns)
+    wire.add(MessageType.EthereumVerifyMessage, "apps.ethereum", "verify_message")
+
+    # apps.lisk
+    ns = [["ed25519", HARDENED | 44, HARDENED | 134]]
+    wire.add(MessageType.LiskGetPublicKey, "apps.lisk", "get_public_key", ns)
+    wire.add(MessageType.LiskGetAddress, "apps.lisk", "get_address", ns)
+    wire.add(MessageType.LiskSignTx, "apps.lisk", "sign_tx", ns)
+    wire.add(MessageType.LiskSignMessage, "apps.lisk", "sign_message", ns)
+    wire.add(MessageType.LiskVerifyMessage, "apps.lisk", "verify_message")
+
+    # apps.monero
+    ns = [["ed25519", HARDENED | 44, HARDENED | 128]]
+    wire.add(MessageType.MoneroGetAddress, "apps.monero", "get_address", ns)
+    wire.add(MessageType.MoneroGetWatchKey, "apps.monero", "get_watch_only", ns)
+    wire.add(MessageType.MoneroTransactionInitRequest, "apps.monero", "sign_tx", ns)
+    wire.add(
+        MessageType.MoneroKeyImageExportInitRequest, "apps.monero", "key_image_sync", ns
+    )
+    wire.add(MessageType.MoneroGetTxKeyRequest, "apps.monero", "get_tx_keys", ns)
+    wire.add(
+        MessageType.MoneroLiveRefreshStartRequest, "apps.monero", "live_refresh", ns
+    )
+    if __debug__ and hasattr(MessageType, "DebugMoneroDiagRequest"):
+        wire.add(MessageType.DebugMoneroDiagRequest, "apps.monero", "diag")
+
+    # apps.nem
+    ns = [
+        ["ed25519-keccak", HARDENED | 44, HARDENED | 43],
+        ["ed25519-keccak", HARDENED | 44, HARDENED | 1],
+    ]
+    wire.add(MessageType.NEMGetAddress, "apps.nem", "get_address", ns)
+    wire.add(MessageType.NEMSignTx, "apps.nem", "sign_tx", ns)
+
+    # apps.stellar
+    ns = [["ed25519", HARDENED | 44, HARDENED | 148]]
+    wire.add(MessageType.StellarGetAddress, "apps.stellar", "get_address", ns)
+    wire.add(MessageType.StellarSignTx, "apps.stellar", "sign_tx", ns)
+
+    # apps.ripple
+    ns = [["secp256k1", HARDENED | 44, HARDENED | 144]]
+    wire.add(MessageType.RippleGetAddress, "apps.ripple", "get_address", ns)
+    wire.add(MessageType.RippleSignTx, "apps.ripple", "sign_tx", ns)
+
+    # apps.cardano
+    wire.add(MessageType.CardanoGetAddress, "apps.cardano", "get_address")
+    wire.add(MessageType.CardanoGetPublicKey, "apps.cardano", "get_public_key")
+    wire.add(MessageType.CardanoSignTx, "apps.cardano", "sign_tx")
+
+    # apps.tezos
+    ns = [["ed25519", HARDENED | 44, HARDENED | 1729]]
+    wire.add(MessageType.TezosGetAddress, "apps.tezos", "get_address", ns)
+    wire.add(MessageType.TezosSignTx, "apps.tezos", "sign_tx", ns)
+    wire.add(MessageType.TezosGetPublicKey, "apps.tezos", "get_public_key", ns)
@@ -42,7 +42,9 @@ class KeyImageSync:
         self.expected_hash = None
         self.enc_key = None
         self.creds = None
-        self.subaddresses = {}
+        self.subaddresses = monero.SubaddressTable()
+        self.derivation_cache = key_image.DerivationCache()
+        self.buff = bytearray(32 * 3)
         self.hasher = crypto.get_keccak()
 
 
@@ -72,7 +74,7 @@ async def _sync_step(s, ctx, tds):
         raise wire.DataError("Empty")
 
     kis = []
-    buff = bytearray(32 * 3)
+    buff = s.buff
     buff_mv = memoryview(buff)
 
     await confirms.keyimage_sync_step(ctx, s.current_output, s.num_outputs)
@@ -89,7 +91,9 @@ async def _sync_step(s, ctx, tds):
         s.hasher.update(key_image.compute_hash(td))
 
         # Compute keyimage + signature
-        ki, sig = key_image.export_key_image(s.creds, s.subaddresses, td)
+        ki, sig = key_image.export_key_image(
+            s.creds, s.subaddresses, td, s.derivation_cache
+        )
 
         # Serialize into buff
         crypto.encodepoint_into(buff_mv[0:32], ki)
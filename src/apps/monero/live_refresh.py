@@ -19,6 +19,12 @@ async def live_refresh(ctx, msg: MoneroLiveRefreshStartRequest, keychain):
     state = LiveRefreshState()
 
     res = await _init_step(state, ctx, msg, keychain)
+
+    # Collect garbage only when needed instead of after each step,
+    # the steps allocate little and there can be thousands of them.
+    gc.collect()
+    gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+
     while True:
         msg = await ctx.call(
             res,
@@ -30,7 +36,6 @@ async def live_refresh(ctx, msg: MoneroLiveRefreshStartRequest, keychain):
             res = await _refresh_step(state, ctx, msg)
         else:
             return MoneroLiveRefreshFinalAck()
-        gc.collect()
 
     return res
 
@@ -39,6 +44,11 @@ class LiveRefreshState:
     def __init__(self):
         self.current_output = -1
         self.creds = None
+        self.buff = bytearray(32 * 3)
+        # subaddress secret key of the last output, consecutive
+        # outputs are often received to the same subaddress
+        self.subaddr_index = None
+        self.subaddr_sk = None
 
 
 async def _init_step(
@@ -56,7 +66,7 @@ async def _init_step(
 
 
 async def _refresh_step(s: LiveRefreshState, ctx, msg: MoneroLiveRefreshStepRequest):
-    buff = bytearray(32 * 3)
+    buff = s.buff
     buff_mv = memoryview(buff)
 
     await confirms.live_refresh_step(ctx, s.current_output)
@@ -73,8 +83,19 @@ async def _refresh_step(s: LiveRefreshState, ctx, msg: MoneroLiveRefreshStepRequ
     out_key = crypto.decodepoint(msg.out_key)
     recv_deriv = crypto.decodepoint(msg.recv_deriv)
     received_index = msg.sub_addr_major, msg.sub_addr_minor
+    if received_index != s.subaddr_index and received_index != (0, 0):
+        s.subaddr_index = received_index
+        s.subaddr_sk = monero.get_subaddress_secret_key(
+            s.creds.view_key_private, major=received_index[0], minor=received_index[1]
+        )
+
     spend_priv, ki = monero.generate_tx_spend_and_key_image(
-        s.creds, out_key, recv_deriv, msg.real_out_idx, received_index
+        s.creds,
+        out_key,
+        recv_deriv,
+        msg.real_out_idx,
+        received_index,
+        s.subaddr_sk if received_index == s.subaddr_index else None,
     )
 
     ki_enc = crypto.encodepoint(ki)
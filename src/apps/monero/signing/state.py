@@ -27,6 +27,7 @@ class State:
     def __init__(self, ctx):
         from apps.monero.xmr.keccak_hasher import KeccakXmrArchive
         from apps.monero.xmr.mlsag_hasher import PreMlsagHasher
+        from apps.monero.xmr.monero import SubaddressTable
 
         self.ctx = ctx
 
@@ -108,7 +109,7 @@ class State:
         # sum of all output' pseudo out masks
         self.sumout = crypto.sc_0()
 
-        self.subaddresses = {}
+        self.subaddresses = SubaddressTable()
 
         # simple stub containing items hashed into tx prefix
         self.tx = TprefixStub(vin=[], vout=[], extra=b"")
@@ -135,14 +136,16 @@ class State:
         self.full_message_hasher = PreMlsagHasher()
         self.full_message = None
 
+        # highest gc.mem_alloc() seen by mem_trace()
+        self.mem_peak = 0
+
     def mem_trace(self, x=None, collect=False):
+        alloc = gc.mem_alloc()
+        if alloc > self.mem_peak:
+            self.mem_peak = alloc
         if __debug__:
             log.debug(
-                __name__,
-                "Log trace: %s, ... F: %s A: %s",
-                x,
-                gc.mem_free(),
-                gc.mem_alloc(),
+                __name__, "Log trace: %s, ... F: %s A: %s", x, gc.mem_free(), alloc
             )
         if collect:
             gc.collect()
@@ -221,6 +221,7 @@ add_keys2_into = tcry.xmr_add_keys2_vartime
 add_keys3 = tcry.xmr_add_keys3_vartime
 add_keys3_into = tcry.xmr_add_keys3_vartime
 gen_commitment = tcry.xmr_gen_c
+mlsag_chain = tcry.xmr_mlsag_chain
 
 
 def generate_key_derivation(pub, sec):
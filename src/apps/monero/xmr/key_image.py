@@ -13,31 +13,67 @@ def compute_hash(rr):
     return kck.digest()
 
 
-def export_key_image(creds, subaddresses, td):
+class DerivationCache:
+    """
+    Remembers the key derivations of the last seen transaction.
+    Outputs of one transaction usually come in a row, computing
+    the derivation is a full scalar multiplication per public key.
+    """
+
+    def __init__(self):
+        self.tx_pub_key = None
+        self.additional_tx_pub_keys = None
+        self.derivations = None
+
+    def get(self, creds, td):
+        if (
+            self.tx_pub_key != td.tx_pub_key
+            or self.additional_tx_pub_keys != td.additional_tx_pub_keys
+        ):
+            self.derivations = monero.generate_key_derivations(
+                creds,
+                crypto.decodepoint(td.tx_pub_key),
+                [crypto.decodepoint(x) for x in td.additional_tx_pub_keys],
+            )
+            self.tx_pub_key = td.tx_pub_key
+            self.additional_tx_pub_keys = td.additional_tx_pub_keys
+        return self.derivations
+
+
+def export_key_image(creds, subaddresses, td, derivation_cache=None):
+    if derivation_cache is None:
+        derivation_cache = DerivationCache()
+
     out_key = crypto.decodepoint(td.out_key)
-    tx_pub_key = crypto.decodepoint(td.tx_pub_key)
-    additional_tx_pub_keys = [crypto.decodepoint(x) for x in td.additional_tx_pub_keys]
+    recv_derivation, additional_recv_derivations = derivation_cache.get(creds, td)
     ki, sig = _export_key_image(
         creds,
         subaddresses,
         out_key,
-        tx_pub_key,
-        additional_tx_pub_keys,
+        recv_derivation,
+        additional_recv_derivations,
         td.internal_output_index,
     )
     return ki, sig
 
 
 def _export_key_image(
-    creds, subaddresses, pkey, tx_pub_key, additional_tx_pub_keys, out_idx, test=True
+    creds,
+    subaddresses,
+    pkey,
+    recv_derivation,
+    additional_recv_derivations,
+    out_idx,
+    test=False,
 ):
     """
-    Generates key image for the TXO + signature for the key image
+    Generates key image for the TXO + signature for the key image.
+    Spend key and key image consistency is already checked
+    by generate_tx_spend_and_key_image(), hence the default test=False.
     """
-    r = monero.generate_tx_spend_and_key_image_and_derivation(
-        creds, subaddresses, pkey, tx_pub_key, additional_tx_pub_keys, out_idx
+    xi, ki = monero.generate_tx_spend_and_key_image_from_derivations(
+        creds, subaddresses, pkey, recv_derivation, additional_recv_derivations, out_idx
     )
-    xi, ki, recv_derivation = r[:3]
 
     phash = crypto.encodepoint(ki)
     sig = generate_ring_signature(phash, ki, [pkey], xi, 0, test)
@@ -76,12 +76,11 @@ def generate_mlsag_simple(message, pubs, in_sk, a, cout, kLRki, index, mg_buff):
     tmp_pt = crypto.new_point()
 
     for i in range(cols):
+        M[32 * i * rows : 32 * i * rows + 32] = pubs[i].dest
         crypto.point_sub_into(
             tmp_pt, crypto.decodepoint_into(tmp_pt, pubs[i].commitment), cout
         )
-
-        M[i][0] = pubs[i].dest
-        M[i][1] = crypto.encodepoint(tmp_pt)
+        crypto.encodepoint_into(M, tmp_pt, 32 * i * rows + 32)
         pubs[i] = None
 
     del pubs
@@ -94,21 +93,17 @@ def gen_mlsag_assert(pk, xx, kLRki, index, dsRows):
     """
     Conditions check
     """
-    cols = len(pk)
+    rows = len(xx)
+    if rows == 0:
+        raise ValueError("Empty pk")
+    if len(pk) % (32 * rows) != 0:
+        raise ValueError("pk is not rectangular")
+
+    cols = len(pk) // (32 * rows)
     if cols <= 1:
         raise ValueError("Cols == 1")
     if index >= cols:
         raise ValueError("Index out of range")
-
-    rows = len(pk[0])
-    if rows == 0:
-        raise ValueError("Empty pk")
-
-    for i in range(cols):
-        if len(pk[i]) != rows:
-            raise ValueError("pk is not rectangular")
-    if len(xx) != rows:
-        raise ValueError("Bad xx size")
     if dsRows > rows:
         raise ValueError("Bad dsRows size")
     if kLRki and dsRows != 1:
@@ -122,15 +117,16 @@ def generate_first_c_and_key_images(message, pk, xx, kLRki, index, dsRows, rows,
     """
     MLSAG computation - the part with secret keys
     :param message: the full message to be signed (actually its hash)
-    :param pk: matrix of public keys and commitments
+    :param pk: packed matrix of public keys and commitments, see `_key_matrix`
     :param xx: input secret array composed of a private key and commitment mask
     :param kLRki: used only in multisig, currently not implemented
     :param index: specifies corresponding public key to the `xx`'s private key in the `pk` array
     :param dsRows: row number where the pubkeys "end" (and commitments follow)
     :param rows: total number of rows
     :param cols: size of ring
+    :return: the first c, packed key images and random scalars alpha
     """
-    II = _key_vector(dsRows)
+    II = bytearray(32 * dsRows)
     alpha = _key_vector(rows)
 
     tmp_buff = bytearray(32)
@@ -138,11 +134,12 @@ def generate_first_c_and_key_images(message, pk, xx, kLRki, index, dsRows, rows,
     aGi = crypto.new_point()
     aHPi = crypto.new_point()
     hasher = _hasher_message(message)
+    pk_index = memoryview(pk)[32 * index * rows : 32 * (index + 1) * rows]
 
     for i in range(dsRows):
         # this is somewhat extra as compared to the Ring Confidential Tx paper
         # see footnote in From Zero to Monero section 3.3
-        hasher.update(pk[index][i])
+        hasher.update(pk_index[32 * i : 32 * i + 32])
         if kLRki:
             raise NotImplementedError("Multisig not implemented")
             # alpha[i] = kLRki.k
@@ -151,16 +148,17 @@ def generate_first_c_and_key_images(message, pk, xx, kLRki, index, dsRows, rows,
             # hash_point(hasher, kLRki.R, tmp_buff)
 
         else:
-            crypto.hash_to_point_into(Hi, pk[index][i])
+            crypto.hash_to_point_into(Hi, pk_index[32 * i : 32 * i + 32])
             alpha[i] = crypto.random_scalar()
             # L = alpha_i * G
             crypto.scalarmult_base_into(aGi, alpha[i])
             # Ri = alpha_i * H(P_i)
             crypto.scalarmult_into(aHPi, Hi, alpha[i])
-            # key image
-            II[i] = crypto.scalarmult(Hi, xx[i])
             _hash_point(hasher, aGi, tmp_buff)
             _hash_point(hasher, aHPi, tmp_buff)
+            # key image
+            crypto.scalarmult_into(aHPi, Hi, xx[i])
+            crypto.encodepoint_into(II, aHPi, 32 * i)
 
     for i in range(dsRows, rows):
         alpha[i] = crypto.random_scalar()
@@ -169,7 +167,7 @@ def generate_first_c_and_key_images(message, pk, xx, kLRki, index, dsRows, rows,
         # for some reasons we omit calculating R here, which seems
         # contrary to the paper, but it is in the Monero official client
         # see https://github.com/monero-project/monero/blob/636153b2050aa0642ba86842c69ac55a5d81618d/src/ringct/rctSigs.cpp#L191
-        hasher.update(pk[index][i])
+        hasher.update(pk_index[32 * i : 32 * i + 32])
         _hash_point(hasher, aGi, tmp_buff)
 
     # the first c
@@ -182,8 +180,11 @@ def generate_mlsag(message, pk, xx, kLRki, index, dsRows, mg_buff):
     """
     Multilayered Spontaneous Anonymous Group Signatures (MLSAG signatures)
 
+    The challenge chain over the ring columns is computed natively
+    in one call, writing the random `ss` directly to `mg_buff`.
+
     :param message: the full message to be signed (actually its hash)
-    :param pk: matrix of public keys and commitments
+    :param pk: packed matrix of public keys and commitments, see `_key_matrix`
     :param xx: input secret array composed of a private key and commitment mask
     :param kLRki: used only in multisig, currently not implemented
     :param index: specifies corresponding public key to the `xx`'s private key in the `pk` array
@@ -198,76 +199,28 @@ def generate_mlsag(message, pk, xx, kLRki, index, dsRows, mg_buff):
         mg_buff.append(None)
 
     mg_buff[0] = int_serialize.dump_uvarint_b(cols)
-    cc = crypto.new_scalar()  # rv.cc
-    c = crypto.new_scalar()
-    L = crypto.new_point()
-    R = crypto.new_point()
-    Hi = crypto.new_point()
+    for i in range(cols):
+        # Serialize size of the row, ss are filled in later
+        mg_buff[i + 1] = bytearray(rows_b_size + 32 * rows)
+        int_serialize.dump_uvarint_b_into(rows, mg_buff[i + 1])
 
     # calculates the "first" c, key images and random scalars alpha
-    c_old, II, alpha = generate_first_c_and_key_images(
+    c, II, alpha = generate_first_c_and_key_images(
         message, pk, xx, kLRki, index, dsRows, rows, cols
     )
 
-    i = (index + 1) % cols
-    if i == 0:
-        crypto.sc_copy(cc, c_old)
-
-    ss = [crypto.new_scalar() for _ in range(rows)]
-    tmp_buff = bytearray(32)
-
-    while i != index:
-        hasher = _hasher_message(message)
-
-        # Serialize size of the row
-        mg_buff[i + 1] = bytearray(rows_b_size + 32 * rows)
-        int_serialize.dump_uvarint_b_into(rows, mg_buff[i + 1])
-
-        for x in ss:
-            crypto.random_scalar(x)
-
-        for j in range(dsRows):
-            # L = rv.ss[i][j] * G + c_old * pk[i][j]
-            crypto.add_keys2_into(
-                L, ss[j], c_old, crypto.decodepoint_into(Hi, pk[i][j])
-            )
-            crypto.hash_to_point_into(Hi, pk[i][j])
-
-            # R = rv.ss[i][j] * H(pk[i][j]) + c_old * Ip[j]
-            crypto.add_keys3_into(R, ss[j], Hi, c_old, II[j])
-
-            hasher.update(pk[i][j])
-            _hash_point(hasher, L, tmp_buff)
-            _hash_point(hasher, R, tmp_buff)
-
-        for j in range(dsRows, rows):
-            # again, omitting R here as discussed above
-            crypto.add_keys2_into(
-                L, ss[j], c_old, crypto.decodepoint_into(Hi, pk[i][j])
-            )
-            hasher.update(pk[i][j])
-            _hash_point(hasher, L, tmp_buff)
-
-        for si in range(rows):
-            crypto.encodeint_into(mg_buff[i + 1], ss[si], rows_b_size + 32 * si)
-
-        crypto.decodeint_into(c, hasher.digest())
-        crypto.sc_copy(c_old, c)
-        pk[i] = None
-        i = (i + 1) % cols
-
-        if i == 0:
-            crypto.sc_copy(cc, c_old)
-        gc.collect()
-
+    # c <- challenge of the column `index`, cc <- challenge of the column 0
+    cc = crypto.new_scalar()  # rv.cc
+    crypto.mlsag_chain(
+        c, cc, message, pk, II, rows, dsRows, index, mg_buff, rows_b_size
+    )
     del II
 
     # Finalizing rv.ss by processing rv.ss[index]
-    mg_buff[index + 1] = bytearray(rows_b_size + 32 * rows)
-    int_serialize.dump_uvarint_b_into(rows, mg_buff[index + 1])
+    ss = crypto.new_scalar()
     for j in range(rows):
-        crypto.sc_mulsub_into(ss[j], c, xx[j], alpha[j])
-        crypto.encodeint_into(mg_buff[index + 1], ss[j], rows_b_size + 32 * j)
+        crypto.sc_mulsub_into(ss, c, xx[j], alpha[j])
+        crypto.encodeint_into(mg_buff[index + 1], ss, rows_b_size + 32 * j)
 
     # rv.cc
     mg_buff[-1] = crypto.encodeint(cc)
@@ -279,12 +232,10 @@ def _key_vector(rows):
 
 def _key_matrix(rows, cols):
     """
-    first index is columns (so slightly backward from math)
+    Packed matrix of encoded keys, first index is columns (so slightly backward from math),
+    key [i][j] is stored at offset 32 * (i * rows + j)
     """
-    rv = [None] * cols
-    for i in range(0, cols):
-        rv[i] = _key_vector(rows)
-    return rv
+    return bytearray(32 * rows * cols)
 
 
 def _generate_random_vector(n):
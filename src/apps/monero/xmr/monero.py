@@ -8,6 +8,9 @@ if False:
 
 DISPLAY_DECIMAL_POINT = const(12)
 
+_SUBADDR_SLOT_SIZE = const(41)  # used flag, spend public key, major, minor
+_SUBADDR_MIN_CAPACITY = const(16)
+
 
 class XmrException(Exception):
     pass
@@ -17,6 +20,91 @@ class XmrNoSuchAddressException(XmrException):
     pass
 
 
+class SubaddressTable:
+    """
+    Maps encoded subaddress spend public keys to (major, minor) indices.
+
+    Open addressing with linear probing over a single bytearray, which is
+    much more compact than a dict of bytes keys and tuple values.
+    Slots are located by the first bytes of the key (keys are EC points,
+    thus uniformly distributed) and verified on the full key.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.capacity = _SUBADDR_MIN_CAPACITY
+        self.table = bytearray(_SUBADDR_SLOT_SIZE * self.capacity)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self.table[self._slot(key)] != 0
+
+    def __getitem__(self, key):
+        res = self.get(key)
+        if res is None:
+            raise KeyError(key)
+        return res
+
+    def __setitem__(self, key, index):
+        if len(key) != 32:
+            raise ValueError("Invalid key length")
+        self.reserve(1)
+        off = self._slot(key)
+        if not self.table[off]:
+            self.table[off] = 1
+            self.table[off + 1 : off + 33] = key
+            self.count += 1
+        self.table[off + 33 : off + 37] = index[0].to_bytes(4, "little")
+        self.table[off + 37 : off + 41] = index[1].to_bytes(4, "little")
+
+    def get(self, key, default=None):
+        off = self._slot(key)
+        if not self.table[off]:
+            return default
+        return (
+            int.from_bytes(self.table[off + 33 : off + 37], "little"),
+            int.from_bytes(self.table[off + 37 : off + 41], "little"),
+        )
+
+    def reserve(self, n):
+        """
+        Makes room for `n` more entries, keeping the load factor under 3/4.
+        """
+        capacity = self.capacity
+        while (self.count + n) * 4 > capacity * 3:
+            capacity <<= 1
+        if capacity == self.capacity:
+            return
+
+        old = self.table
+        self.capacity = capacity
+        self.table = bytearray(_SUBADDR_SLOT_SIZE * capacity)
+        for old_off in range(0, len(old), _SUBADDR_SLOT_SIZE):
+            if old[old_off]:
+                off = self._slot(old[old_off + 1 : old_off + 33])
+                self.table[off : off + _SUBADDR_SLOT_SIZE] = old[
+                    old_off : old_off + _SUBADDR_SLOT_SIZE
+                ]
+
+    def _slot(self, key):
+        """
+        Returns offset of the slot holding `key` or of the empty slot
+        the key would be stored to.
+        """
+        table = self.table
+        mask = self.capacity - 1
+        i = (key[0] | (key[1] << 8) | (key[2] << 16)) & mask
+        while True:
+            off = i * _SUBADDR_SLOT_SIZE
+            if not table[off]:
+                return off
+            if table[off + 1] == key[0] and table[off + 1 : off + 33] == key:
+                return off
+            i = (i + 1) & mask
+
+
 def get_subaddress_secret_key(secret_key, index=None, major=None, minor=None):
     """
     Builds subaddress secret key from the subaddress index
@@ -66,7 +154,7 @@ def generate_key_image(public_key, secret_key):
 
 
 def is_out_to_account(
-    subaddresses: dict,
+    subaddresses: SubaddressTable,
     out_key: Ge25519,
     derivation: Ge25519,
     additional_derivations: list,
@@ -81,8 +169,9 @@ def is_out_to_account(
     subaddress_spendkey = crypto.encodepoint(
         derive_subaddress_public_key(out_key, derivation, output_index)
     )
-    if subaddress_spendkey in subaddresses:
-        return subaddresses[subaddress_spendkey], derivation
+    subaddr_index = subaddresses.get(subaddress_spendkey)
+    if subaddr_index is not None:
+        return subaddr_index, derivation
 
     if additional_derivations and len(additional_derivations) > 0:
         if output_index >= len(additional_derivations):
@@ -92,17 +181,20 @@ def is_out_to_account(
             out_key, additional_derivations[output_index], output_index
         )
         subaddress_spendkey = crypto.encodepoint(subaddress_spendkey)
-        if subaddress_spendkey in subaddresses:
-            return (
-                subaddresses[subaddress_spendkey],
-                additional_derivations[output_index],
-            )
+        subaddr_index = subaddresses.get(subaddress_spendkey)
+        if subaddr_index is not None:
+            return subaddr_index, additional_derivations[output_index]
 
     return None
 
 
 def generate_tx_spend_and_key_image(
-    ack, out_key, recv_derivation, real_output_index, received_index: tuple
+    ack,
+    out_key,
+    recv_derivation,
+    real_output_index,
+    received_index: tuple,
+    subaddr_sk: Sc25519 = None,
 ) -> Optional[Tuple[Sc25519, Ge25519]]:
     """
     Generates UTXO spending key and key image.
@@ -114,6 +206,7 @@ def generate_tx_spend_and_key_image(
     :param recv_derivation:
     :param real_output_index:
     :param received_index: subaddress index this payment was received to
+    :param subaddr_sk: precomputed subaddress secret key of received_index, optional
     :return:
     """
     if not crypto.sc_isnonzero(ack.spend_key_private):
@@ -125,13 +218,13 @@ def generate_tx_spend_and_key_image(
     )
 
     # step 2: add Hs(SubAddr || a || index_major || index_minor)
-    subaddr_sk = None
     if received_index == (0, 0):
         scalar_step2 = scalar_step1
     else:
-        subaddr_sk = get_subaddress_secret_key(
-            ack.view_key_private, major=received_index[0], minor=received_index[1]
-        )
+        if subaddr_sk is None:
+            subaddr_sk = get_subaddress_secret_key(
+                ack.view_key_private, major=received_index[0], minor=received_index[1]
+            )
         scalar_step2 = crypto.sc_add(scalar_step1, subaddr_sk)
 
     # When not in multisig, we know the full spend secret key, so the output pubkey can be obtained by scalarmultBase
@@ -161,7 +254,7 @@ def generate_tx_spend_and_key_image(
 
 def generate_tx_spend_and_key_image_and_derivation(
     creds,
-    subaddresses: dict,
+    subaddresses: SubaddressTable,
     out_key: Ge25519,
     tx_public_key: Ge25519,
     additional_tx_public_keys: list,
@@ -180,6 +273,28 @@ def generate_tx_spend_and_key_image_and_derivation(
     :param real_output_index: index of the real output in the RCT
     :return:
     """
+    recv_derivation, additional_recv_derivations = generate_key_derivations(
+        creds, tx_public_key, additional_tx_public_keys
+    )
+
+    xi, ki = generate_tx_spend_and_key_image_from_derivations(
+        creds,
+        subaddresses,
+        out_key,
+        recv_derivation,
+        additional_recv_derivations,
+        real_output_index,
+    )
+    return xi, ki, recv_derivation
+
+
+def generate_key_derivations(
+    creds, tx_public_key: Ge25519, additional_tx_public_keys: list
+) -> Tuple[Ge25519, list]:
+    """
+    Computes the receive derivation and the additional receive derivations
+    of a transaction, using the view private key.
+    """
     recv_derivation = crypto.generate_key_derivation(
         tx_public_key, creds.view_key_private
     )
@@ -189,7 +304,21 @@ def generate_tx_spend_and_key_image_and_derivation(
         additional_recv_derivations.append(
             crypto.generate_key_derivation(add_pub_key, creds.view_key_private)
         )
+    return recv_derivation, additional_recv_derivations
+
 
+def generate_tx_spend_and_key_image_from_derivations(
+    creds,
+    subaddresses: SubaddressTable,
+    out_key: Ge25519,
+    recv_derivation: Ge25519,
+    additional_recv_derivations: list,
+    real_output_index: int,
+) -> Tuple[Sc25519, Ge25519]:
+    """
+    Generates UTXO spending key and key image from precomputed derivations,
+    see generate_key_derivations().
+    """
     subaddr_recv_info = is_out_to_account(
         subaddresses,
         out_key,
@@ -200,10 +329,9 @@ def generate_tx_spend_and_key_image_and_derivation(
     if subaddr_recv_info is None:
         raise XmrNoSuchAddressException("No such addr")
 
-    xi, ki = generate_tx_spend_and_key_image(
+    return generate_tx_spend_and_key_image(
         creds, out_key, subaddr_recv_info[1], real_output_index, subaddr_recv_info[0]
     )
-    return xi, ki, recv_derivation
 
 
 def compute_subaddresses(creds, account: int, indices, subaddresses=None):
@@ -213,11 +341,12 @@ def compute_subaddresses(creds, account: int, indices, subaddresses=None):
     :param creds: credentials
     :param account: major index
     :param indices: array of minor indices
-    :param subaddresses: subaddress dict. optional.
+    :param subaddresses: subaddress table to extend. optional.
     :return:
     """
     if subaddresses is None:
-        subaddresses = {}
+        subaddresses = SubaddressTable()
+    subaddresses.reserve(len(indices))
 
     for idx in indices:
         if account == 0 and idx == 0:
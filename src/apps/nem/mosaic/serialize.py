@@ -7,57 +7,100 @@ from ..helpers import (
     NEM_TRANSACTION_TYPE_MOSAIC_SUPPLY_CHANGE,
 )
 from ..writers import (
+    mosaic_identifier_length,
     serialize_tx_common,
     write_bytes_with_len,
+    write_mosaic_identifier,
     write_uint32_le,
     write_uint64_le,
 )
 
+# mosaic definition properties in the serialized order, with their default values
+_PROPERTIES = (
+    (b"divisibility", 0),
+    (b"initialSupply", 0),
+    (b"supplyMutable", False),
+    (b"transferable", False),
+)
+
 
 def serialize_mosaic_creation(
     common: NEMTransactionCommon, creation: NEMMosaicCreation, public_key: bytes
 ):
-    w = serialize_tx_common(common, public_key, NEM_TRANSACTION_TYPE_MOSAIC_CREATION)
-
-    mosaics_w = bytearray()
-    write_bytes_with_len(mosaics_w, public_key)
-
-    identifier_w = bytearray()
-    write_bytes_with_len(identifier_w, creation.definition.namespace.encode())
-    write_bytes_with_len(identifier_w, creation.definition.mosaic.encode())
-
-    write_bytes_with_len(mosaics_w, identifier_w)
-    write_bytes_with_len(mosaics_w, creation.definition.description.encode())
-    write_uint32_le(mosaics_w, 4)  # number of properties
-
-    _write_property(mosaics_w, "divisibility", creation.definition.divisibility)
-    _write_property(mosaics_w, "initialSupply", creation.definition.supply)
-    _write_property(mosaics_w, "supplyMutable", creation.definition.mutable_supply)
-    _write_property(mosaics_w, "transferable", creation.definition.transferable)
-
-    if creation.definition.levy:
-
-        levy_identifier_w = bytearray()
-        write_bytes_with_len(
-            levy_identifier_w, creation.definition.levy_namespace.encode()
-        )
-        write_bytes_with_len(
-            levy_identifier_w, creation.definition.levy_mosaic.encode()
+    definition = creation.definition
+    namespace = definition.namespace.encode()
+    mosaic = definition.mosaic.encode()
+    description = definition.description.encode()
+    sink = creation.sink.encode()
+
+    properties = []
+    values = (
+        definition.divisibility,
+        definition.supply,
+        definition.mutable_supply,
+        definition.transferable,
+    )
+    for (name, default), value in zip(_PROPERTIES, values):
+        if value is None:
+            value = default
+        properties.append((name, _encode_property(value)))
+
+    # creator public key, identifier, description and properties
+    definition_length = (
+        4
+        + len(public_key)
+        + mosaic_identifier_length(namespace, mosaic)
+        + 4
+        + len(description)
+        + 4
+    )
+    for name, value in properties:
+        definition_length += 4 + 4 + len(name) + 4 + len(value)
+
+    if definition.levy:
+        levy_address = definition.levy_address.encode()
+        levy_namespace = definition.levy_namespace.encode()
+        levy_mosaic = definition.levy_mosaic.encode()
+        # levy type, address, identifier and fee
+        levy_length = (
+            4
+            + 4
+            + len(levy_address)
+            + mosaic_identifier_length(levy_namespace, levy_mosaic)
+            + 8
         )
+        definition_length += 4 + levy_length
+    else:
+        definition_length += 4  # no levy
 
-        levy_w = bytearray()
-        write_uint32_le(levy_w, creation.definition.levy)
-        write_bytes_with_len(levy_w, creation.definition.levy_address.encode())
-        write_bytes_with_len(levy_w, levy_identifier_w)
-        write_uint64_le(levy_w, creation.definition.fee)
+    w = serialize_tx_common(
+        common,
+        public_key,
+        NEM_TRANSACTION_TYPE_MOSAIC_CREATION,
+        length=4 + definition_length + 4 + len(sink) + 8,
+    )
 
-        write_bytes_with_len(mosaics_w, levy_w)
+    write_uint32_le(w, definition_length)
+    write_bytes_with_len(w, public_key)
+    write_mosaic_identifier(w, namespace, mosaic)
+    write_bytes_with_len(w, description)
+
+    write_uint32_le(w, len(properties))
+    for name, value in properties:
+        write_uint32_le(w, 4 + len(name) + 4 + len(value))
+        write_bytes_with_len(w, name)
+        write_bytes_with_len(w, value)
+
+    if definition.levy:
+        write_uint32_le(w, levy_length)
+        write_uint32_le(w, definition.levy)
+        write_bytes_with_len(w, levy_address)
+        write_mosaic_identifier(w, levy_namespace, levy_mosaic)
+        write_uint64_le(w, definition.fee)
     else:
-        write_uint32_le(mosaics_w, 0)  # no levy
+        write_uint32_le(w, 0)  # no levy
 
-    write_bytes_with_len(w, mosaics_w)
-
-    write_bytes_with_len(w, creation.sink.encode())
+    write_bytes_with_len(w, sink)
     write_uint64_le(w, creation.fee)
 
     return w
@@ -66,27 +109,23 @@ def serialize_mosaic_creation(
 def serialize_mosaic_supply_change(
     common: NEMTransactionCommon, change: NEMMosaicSupplyChange, public_key: bytes
 ):
+    namespace = change.namespace.encode()
+    mosaic = change.mosaic.encode()
+
     w = serialize_tx_common(
-        common, public_key, NEM_TRANSACTION_TYPE_MOSAIC_SUPPLY_CHANGE
+        common,
+        public_key,
+        NEM_TRANSACTION_TYPE_MOSAIC_SUPPLY_CHANGE,
+        length=mosaic_identifier_length(namespace, mosaic) + 4 + 8,
     )
 
-    identifier_w = bytearray()
-    write_bytes_with_len(identifier_w, change.namespace.encode())
-    write_bytes_with_len(identifier_w, change.mosaic.encode())
-
-    write_bytes_with_len(w, identifier_w)
-
+    write_mosaic_identifier(w, namespace, mosaic)
     write_uint32_le(w, change.type)
     write_uint64_le(w, change.delta)
     return w
 
 
-def _write_property(w: bytearray, name: str, value):
-    if value is None:
-        if name in ("divisibility", "initialSupply"):
-            value = 0
-        elif name in ("supplyMutable", "transferable"):
-            value = False
+def _encode_property(value) -> bytes:
     if type(value) == bool:
         if value:
             value = "true"
@@ -96,8 +135,4 @@ def _write_property(w: bytearray, name: str, value):
         value = str(value)
     if type(value) != str:
         raise ValueError("Incompatible value type")
-    name = name.encode()
-    value = value.encode()
-    write_uint32_le(w, 4 + len(name) + 4 + len(value))
-    write_bytes_with_len(w, name)
-    write_bytes_with_len(w, value)
+    return value.encode()
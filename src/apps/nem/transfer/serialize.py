@@ -11,8 +11,10 @@ from ..helpers import (
     NEM_TRANSACTION_TYPE_TRANSFER,
 )
 from ..writers import (
+    mosaic_identifier_length,
     serialize_tx_common,
     write_bytes_with_len,
+    write_mosaic_identifier,
     write_uint32_le,
     write_uint64_le,
 )
@@ -25,14 +27,25 @@ def serialize_transfer(
     payload: bytes = None,
     encrypted: bool = False,
 ) -> bytearray:
+    recipient = transfer.recipient.encode()
+
+    # recipient, amount, payload and number of mosaics, the mosaics themselves
+    # are appended by serialize_mosaic()
+    length = 4 + len(recipient) + 8 + 4
+    if payload:
+        length += 4 + 4 + len(payload)
+    if transfer.mosaics:
+        length += 4
+
     tx = serialize_tx_common(
         common,
         public_key,
         NEM_TRANSACTION_TYPE_TRANSFER,
         _get_version(common.network, transfer.mosaics),
+        length,
     )
 
-    write_bytes_with_len(tx, transfer.recipient.encode())
+    write_bytes_with_len(tx, recipient)
     write_uint64_le(tx, transfer.amount)
 
     if payload:
@@ -53,22 +66,26 @@ def serialize_transfer(
 
 
 def serialize_mosaic(w: bytearray, namespace: str, mosaic: str, quantity: int):
-    identifier_w = bytearray()
-    write_bytes_with_len(identifier_w, namespace.encode())
-    write_bytes_with_len(identifier_w, mosaic.encode())
+    namespace = namespace.encode()
+    mosaic = mosaic.encode()
+    write_uint32_le(w, _mosaic_length(namespace, mosaic) - 4)
+    write_mosaic_identifier(w, namespace, mosaic)
+    write_uint64_le(w, quantity)
 
-    mosaic_w = bytearray()
-    write_bytes_with_len(mosaic_w, identifier_w)
-    write_uint64_le(mosaic_w, quantity)
 
-    write_bytes_with_len(w, mosaic_w)
+def _mosaic_length(namespace: bytes, mosaic: bytes) -> int:
+    # length prefix, identifier and quantity
+    return 4 + mosaic_identifier_length(namespace, mosaic) + 8
 
 
 def serialize_importance_transfer(
     common: NEMTransactionCommon, imp: NEMImportanceTransfer, public_key: bytes
 ) -> bytearray:
     w = serialize_tx_common(
-        common, public_key, NEM_TRANSACTION_TYPE_IMPORTANCE_TRANSFER
+        common,
+        public_key,
+        NEM_TRANSACTION_TYPE_IMPORTANCE_TRANSFER,
+        length=4 + 4 + len(imp.public_key),
     )
 
     write_uint32_le(w, imp.mode)
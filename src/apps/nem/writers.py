@@ -1,6 +1,17 @@
+from micropython import const
+
 from trezor.messages.NEMTransactionCommon import NEMTransactionCommon
 
-from apps.common.writers import write_bytes, write_uint32_le, write_uint64_le
+from apps.common.writers import (
+    empty_bytearray,
+    write_bytes,
+    write_uint32_le,
+    write_uint64_le,
+)
+
+# length of the common transaction fields without the public key itself:
+# type, version, timestamp, public key length, fee and deadline
+_TX_COMMON_LENGTH = const(4 + 4 + 4 + 4 + 8 + 4)
 
 
 def serialize_tx_common(
@@ -8,8 +19,13 @@ def serialize_tx_common(
     public_key: bytearray,
     transaction_type: int,
     version: int = None,
+    length: int = 0,
 ) -> bytearray:
-    w = bytearray()
+    """
+    `length` is the length of the transaction-specific fields which follow,
+    the buffer is preallocated to fit them.
+    """
+    w = empty_bytearray(_TX_COMMON_LENGTH + len(public_key) + length)
 
     write_uint32_le(w, transaction_type)
     if version is None:
@@ -27,3 +43,14 @@ def serialize_tx_common(
 def write_bytes_with_len(w, buf: bytes):
     write_uint32_le(w, len(buf))
     write_bytes(w, buf)
+
+
+def write_mosaic_identifier(w, namespace: bytes, mosaic: bytes):
+    write_uint32_le(w, mosaic_identifier_length(namespace, mosaic) - 4)
+    write_bytes_with_len(w, namespace)
+    write_bytes_with_len(w, mosaic)
+
+
+def mosaic_identifier_length(namespace: bytes, mosaic: bytes) -> int:
+    # including the length prefix written by write_mosaic_identifier()
+    return 4 + 4 + len(namespace) + 4 + len(mosaic)
@@ -1,12 +1 @@
-from trezor import wire
-from trezor.messages import MessageType
-
-from apps.common import HARDENED
-
 CURVE = "secp256k1"
-
-
-def boot():
-    ns = [[CURVE, HARDENED | 44, HARDENED | 144]]
-    wire.add(MessageType.RippleGetAddress, __name__, "get_address", ns)
-    wire.add(MessageType.RippleSignTx, __name__, "sign_tx", ns)
@@ -12,6 +12,8 @@ from micropython import const
 
 from trezor.messages.RippleSignTx import RippleSignTx
 
+from apps.common.writers import empty_bytearray
+
 from . import helpers
 
 FIELD_TYPE_INT16 = 1
@@ -20,65 +22,86 @@ FIELD_TYPE_AMOUNT = 6
 FIELD_TYPE_VL = 7
 FIELD_TYPE_ACCOUNT = 8
 
-FIELDS_MAP = {
-    "account": {"type": FIELD_TYPE_ACCOUNT, "key": 1},
-    "amount": {"type": FIELD_TYPE_AMOUNT, "key": 1},
-    "destination": {"type": FIELD_TYPE_ACCOUNT, "key": 3},
-    "fee": {"type": FIELD_TYPE_AMOUNT, "key": 8},
-    "sequence": {"type": FIELD_TYPE_INT32, "key": 4},
-    "type": {"type": FIELD_TYPE_INT16, "key": 2},
-    "signingPubKey": {"type": FIELD_TYPE_VL, "key": 3},
-    "flags": {"type": FIELD_TYPE_INT32, "key": 2},
-    "txnSignature": {"type": FIELD_TYPE_VL, "key": 4},
-    "lastLedgerSequence": {"type": FIELD_TYPE_INT32, "key": 27},
-    "destinationTag": {"type": FIELD_TYPE_INT32, "key": 14},
-}
+# (field type, serialized field id), the id is the type in the upper four bits
+# and the key in the lower four bits, keys above 0xF follow in a second byte
+FIELD_ACCOUNT = (FIELD_TYPE_ACCOUNT, b"\x81")  # key 1
+FIELD_AMOUNT = (FIELD_TYPE_AMOUNT, b"\x61")  # key 1
+FIELD_DESTINATION = (FIELD_TYPE_ACCOUNT, b"\x83")  # key 3
+FIELD_FEE = (FIELD_TYPE_AMOUNT, b"\x68")  # key 8
+FIELD_SEQUENCE = (FIELD_TYPE_INT32, b"\x24")  # key 4
+FIELD_TYPE = (FIELD_TYPE_INT16, b"\x12")  # key 2
+FIELD_SIGNING_PUB_KEY = (FIELD_TYPE_VL, b"\x73")  # key 3
+FIELD_FLAGS = (FIELD_TYPE_INT32, b"\x22")  # key 2
+FIELD_TXN_SIGNATURE = (FIELD_TYPE_VL, b"\x74")  # key 4
+FIELD_LAST_LEDGER_SEQUENCE = (FIELD_TYPE_INT32, b"\x20\x1b")  # key 27
+FIELD_DESTINATION_TAG = (FIELD_TYPE_INT32, b"\x2e")  # key 14
 
 TRANSACTION_TYPES = {"Payment": 0}
 
 
-def serialize(msg: RippleSignTx, source_address: str, pubkey=None, signature=None):
-    w = bytearray()
+def serialize(
+    msg: RippleSignTx, source_address: str, pubkey=None, signature=None, w=None
+):
+    """
+    Serializes the transaction into `w` if given (e.g. a HashWriter),
+    otherwise into a new bytearray of the exact serialized length.
+    """
     # must be sorted numerically first by type and then by name
-    write(w, FIELDS_MAP["type"], TRANSACTION_TYPES["Payment"])
-    write(w, FIELDS_MAP["flags"], msg.flags)
-    write(w, FIELDS_MAP["sequence"], msg.sequence)
-    write(w, FIELDS_MAP["destinationTag"], msg.payment.destination_tag)
-    write(w, FIELDS_MAP["lastLedgerSequence"], msg.last_ledger_sequence)
-    write(w, FIELDS_MAP["amount"], msg.payment.amount)
-    write(w, FIELDS_MAP["fee"], msg.fee)
-    write(w, FIELDS_MAP["signingPubKey"], pubkey)
-    write(w, FIELDS_MAP["txnSignature"], signature)
-    write(w, FIELDS_MAP["account"], source_address)
-    write(w, FIELDS_MAP["destination"], msg.payment.destination)
+    fields = (
+        (FIELD_TYPE, TRANSACTION_TYPES["Payment"]),
+        (FIELD_FLAGS, msg.flags),
+        (FIELD_SEQUENCE, msg.sequence),
+        (FIELD_DESTINATION_TAG, msg.payment.destination_tag),
+        (FIELD_LAST_LEDGER_SEQUENCE, msg.last_ledger_sequence),
+        (FIELD_AMOUNT, msg.payment.amount),
+        (FIELD_FEE, msg.fee),
+        (FIELD_SIGNING_PUB_KEY, pubkey),
+        (FIELD_TXN_SIGNATURE, signature),
+        (FIELD_ACCOUNT, helpers.decode_address(source_address)),
+        (FIELD_DESTINATION, helpers.decode_address(msg.payment.destination)),
+    )
+    if w is None:
+        length = 0
+        for field, value in fields:
+            length += field_length(field, value)
+        w = empty_bytearray(length)
+    for field, value in fields:
+        write(w, field, value)
     return w
 
 
-def write(w: bytearray, field: dict, value):
+def write(w: bytearray, field: tuple, value):
     if value is None:
         return
-    write_type(w, field)
-    if field["type"] == FIELD_TYPE_INT16:
+    field_type, field_id = field
+    w.extend(field_id)
+    if field_type == FIELD_TYPE_INT16:
         w.extend(value.to_bytes(2, "big"))
-    elif field["type"] == FIELD_TYPE_INT32:
+    elif field_type == FIELD_TYPE_INT32:
         w.extend(value.to_bytes(4, "big"))
-    elif field["type"] == FIELD_TYPE_AMOUNT:
+    elif field_type == FIELD_TYPE_AMOUNT:
         w.extend(serialize_amount(value))
-    elif field["type"] == FIELD_TYPE_ACCOUNT:
-        write_bytes(w, helpers.decode_address(value))
-    elif field["type"] == FIELD_TYPE_VL:
+    elif field_type == FIELD_TYPE_ACCOUNT or field_type == FIELD_TYPE_VL:
+        # accounts are expected to be already decoded into the Account ID
         write_bytes(w, value)
     else:
         raise ValueError("Unknown field type")
 
 
-def write_type(w: bytearray, field: dict):
-    if field["key"] <= 0xF:
-        w.append((field["type"] << 4) | field["key"])
+def field_length(field: tuple, value) -> int:
+    if value is None:
+        return 0
+    field_type, field_id = field
+    if field_type == FIELD_TYPE_INT16:
+        return len(field_id) + 2
+    elif field_type == FIELD_TYPE_INT32:
+        return len(field_id) + 4
+    elif field_type == FIELD_TYPE_AMOUNT:
+        return len(field_id) + 8
+    elif field_type == FIELD_TYPE_ACCOUNT or field_type == FIELD_TYPE_VL:
+        return len(field_id) + varint_length(len(value)) + len(value)
     else:
-        # this concerns two-bytes fields such as lastLedgerSequence
-        w.append(field["type"] << 4)
-        w.append(field["key"])
+        raise ValueError("Unknown field type")
 
 
 def serialize_amount(value: int) -> bytearray:
@@ -123,6 +146,15 @@ def write_varint(w: bytearray, val: int):
         raise ValueError("Value is too large")
 
 
+def varint_length(val: int) -> int:
+    if val < 192:
+        return 1
+    elif val <= 12480:
+        return 2
+    else:
+        return 3
+
+
 def rshift(val, n):
     """
     Implements signed right-shift.
@@ -3,6 +3,7 @@ from trezor.crypto.curve import secp256k1
 from trezor.crypto.hashlib import sha512
 from trezor.messages.RippleSignedTx import RippleSignedTx
 from trezor.messages.RippleSignTx import RippleSignTx
+from trezor.utils import HashWriter
 from trezor.wire import ProcessError
 
 from apps.common import paths
@@ -21,8 +22,9 @@ async def sign_tx(ctx, msg: RippleSignTx, keychain):
     source_address = helpers.address_from_public_key(node.public_key())
 
     set_canonical_flag(msg)
-    tx = serialize(msg, source_address, pubkey=node.public_key())
-    to_sign = get_network_prefix() + tx
+    to_sign = HashWriter(sha512())
+    to_sign.extend(get_network_prefix())
+    serialize(msg, source_address, pubkey=node.public_key(), w=to_sign)
 
     check_fee(msg.fee)
     if msg.payment.destination_tag is not None:
@@ -45,10 +47,9 @@ def get_network_prefix():
     return helpers.HASH_TX_SIGN.to_bytes(4, "big")
 
 
-def first_half_of_sha512(b):
+def first_half_of_sha512(h: HashWriter):
     """First half of SHA512, which Ripple uses"""
-    hash = sha512(b)
-    return hash.digest()[:32]
+    return h.get_digest()[:32]
 
 
 def ecdsa_sign(private_key: bytes, digest: bytes) -> bytes:
@@ -5,6 +5,7 @@ from trezor.crypto.hashlib import sha256
 from trezor.messages.StellarSignedTx import StellarSignedTx
 from trezor.messages.StellarSignTx import StellarSignTx
 from trezor.messages.StellarTxOpRequest import StellarTxOpRequest
+from trezor.utils import HashWriter
 from trezor.wire import ProcessError
 
 from apps.common import paths, seed
@@ -23,7 +24,8 @@ async def sign_tx(ctx, msg: StellarSignTx, keychain):
     if msg.num_operations == 0:
         raise ProcessError("Stellar: At least one operation is required")
 
-    w = bytearray()
+    # the transaction is hashed as it is serialized, operation by operation
+    w = HashWriter(sha256())
     await _init(ctx, w, pubkey, msg)
     _timebounds(w, msg.timebounds_start, msg.timebounds_end)
     await _memo(ctx, w, msg)
@@ -31,7 +33,7 @@ async def sign_tx(ctx, msg: StellarSignTx, keychain):
     await _final(ctx, w, msg)
 
     # sign
-    digest = sha256(w).digest()
+    digest = w.get_digest()
     signature = ed25519.sign(node.private_key(), digest)
 
     # Add the public key for verification that the right account was used for signing
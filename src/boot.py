@@ -1,4 +1,4 @@
-from trezor import config, log, loop, res, ui
+from trezor import config, log, loop, profiler, res, ui
 from trezor.pin import pin_to_int, show_pin_timeout
 
 from apps.common import storage
@@ -56,6 +56,8 @@ async def lockscreen():
 
 ui.display.backlight(ui.BACKLIGHT_NONE)
 ui.backlight_slide_sync(ui.BACKLIGHT_NORMAL)
-config.init(show_pin_timeout)
-loop.schedule(bootscreen())
-loop.run()
+with profiler.phase("config init"):
+    config.init(show_pin_timeout)
+with profiler.phase("unlock"):
+    loop.schedule(bootscreen())
+    loop.run()
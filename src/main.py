@@ -1,53 +1,44 @@
 # isort:skip_file
 
+# measure the boot phases, see trezor/profiler.py
+from trezor import profiler
+
 # unlock the device
-import boot  # noqa: F401
+with profiler.phase("boot"):
+    import boot  # noqa: F401
 
 # prepare the USB interfaces, but do not connect to the host yet
-import usb
+with profiler.phase("usb"):
+    import usb
 
 from trezor import loop, wire, workflow, utils
 
-# load applications
-import apps.homescreen
-import apps.management
-import apps.wallet
-import apps.ethereum
-import apps.lisk
-import apps.monero
-import apps.nem
-import apps.stellar
-import apps.ripple
-import apps.cardano
-import apps.tezos
-
-if __debug__:
-    import apps.debug
-else:
-    import apps.webauthn
+# load applications, the rest is imported on their first message, see
+# apps/manifest.py
+with profiler.phase("import apps"):
+    import apps.homescreen
+    import apps.manifest
+
+    if __debug__:
+        import apps.debug
+    else:
+        import apps.webauthn
 
 # boot applications
-apps.homescreen.boot()
-apps.management.boot()
-apps.wallet.boot()
-apps.ethereum.boot()
-apps.lisk.boot()
-apps.monero.boot()
-apps.nem.boot()
-apps.stellar.boot()
-apps.ripple.boot()
-apps.cardano.boot()
-apps.tezos.boot()
-if __debug__:
-    apps.debug.boot()
-else:
-    apps.webauthn.boot(usb.iface_webauthn)
+with profiler.phase("boot apps"):
+    apps.homescreen.boot()
+    apps.manifest.boot()
+    if __debug__:
+        apps.debug.boot()
+    else:
+        apps.webauthn.boot(usb.iface_webauthn)
 
 # initialize the wire codec and start the USB
-wire.setup(usb.iface_wire)
-if __debug__:
-    wire.setup(usb.iface_debug)
-usb.bus.open()
+with profiler.phase("wire"):
+    wire.setup(usb.iface_wire)
+    if __debug__:
+        wire.setup(usb.iface_debug)
+    usb.bus.open()
 
 # switch into unprivileged mode, as we don't need the extra permissions anymore
 utils.set_mode_unprivileged()
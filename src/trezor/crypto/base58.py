@@ -13,50 +13,33 @@
 # This module adds shiny packaging and support for python3.
 #
 
+from trezorcrypto import base58 as _base58
+
 # 58 character alphabet used
 _alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 
 
+def _translate(string: str, src: str, dst: str) -> str:
+    return "".join([dst[src.index(c)] for c in string])
+
+
 def encode(data: bytes, alphabet=_alphabet) -> str:
     """
     Convert bytes to base58 encoded string.
     """
-    origlen = len(data)
-    data = data.lstrip(b"\0")
-    newlen = len(data)
-
-    p, acc = 1, 0
-    for c in reversed(data):
-        acc += p * c
-        p = p << 8
-
-    result = ""
-    while acc > 0:
-        acc, mod = divmod(acc, 58)
-        result += alphabet[mod]
-
-    return "".join((c for c in reversed(result + alphabet[0] * (origlen - newlen))))
+    result = _base58.encode(data)
+    if alphabet != _alphabet:
+        result = _translate(result, _alphabet, alphabet)
+    return result
 
 
 def decode(string: str, alphabet=_alphabet) -> bytes:
     """
     Convert base58 encoded string to bytes.
     """
-    origlen = len(string)
-    string = string.lstrip(alphabet[0])
-    newlen = len(string)
-
-    p, acc = 1, 0
-    for c in reversed(string):
-        acc += p * alphabet.index(c)
-        p *= 58
-
-    result = []
-    while acc > 0:
-        acc, mod = divmod(acc, 256)
-        result.append(mod)
-
-    return bytes((b for b in reversed(result + [0] * (origlen - newlen))))
+    if alphabet != _alphabet:
+        string = _translate(string, alphabet, _alphabet)
+    return _base58.decode(string)
 
 
 def sha256d_32(data: bytes) -> bytes:
@@ -24,15 +24,47 @@
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 
 
-def bech32_polymod(values):
+# XOR of the generator constants selected by the top five bits of the checksum
+_GENERATOR = (
+    0x00000000,
+    0x3B6A57B2,
+    0x26508E6D,
+    0x1D3AD9DF,
+    0x1EA119FA,
+    0x25CB4E48,
+    0x38F19797,
+    0x039BC025,
+    0x3D4233DD,
+    0x0628646F,
+    0x1B12BDB0,
+    0x2078EA02,
+    0x23E32A27,
+    0x18897D95,
+    0x05B3A44A,
+    0x3ED9F3F8,
+    0x2A1462B3,
+    0x117E3501,
+    0x0C44ECDE,
+    0x372EBB6C,
+    0x34B57B49,
+    0x0FDF2CFB,
+    0x12E5F524,
+    0x298FA296,
+    0x1756516E,
+    0x2C3C06DC,
+    0x3106DF03,
+    0x0A6C88B1,
+    0x09F74894,
+    0x329D1F26,
+    0x2FA7C6F9,
+    0x14CD914B,
+)
+
+
+def bech32_polymod(values, chk=1):
     """Internal function that computes the Bech32 checksum."""
-    generator = [0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3]
-    chk = 1
     for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1FFFFFF) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+        chk = ((chk & 0x1FFFFFF) << 5) ^ value ^ _GENERATOR[chk >> 25]
     return chk
 
 
@@ -41,22 +73,38 @@ def bech32_hrp_expand(hrp):
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
+def _hrp_polymod(hrp):
+    """Checksum of the expanded HRP, without expanding it."""
+    chk = 1
+    for x in hrp:
+        chk = ((chk & 0x1FFFFFF) << 5) ^ (ord(x) >> 5) ^ _GENERATOR[chk >> 25]
+    chk = ((chk & 0x1FFFFFF) << 5) ^ _GENERATOR[chk >> 25]
+    for x in hrp:
+        chk = ((chk & 0x1FFFFFF) << 5) ^ (ord(x) & 31) ^ _GENERATOR[chk >> 25]
+    return chk
+
+
 def bech32_verify_checksum(hrp, data):
     """Verify a checksum given HRP and converted data characters."""
-    return bech32_polymod(bech32_hrp_expand(hrp) + data) == 1
+    return bech32_polymod(data, _hrp_polymod(hrp)) == 1
 
 
 def bech32_create_checksum(hrp, data):
     """Compute the checksum values given HRP and data."""
-    values = bech32_hrp_expand(hrp) + data
-    polymod = bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ 1
-    return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+    polymod = bech32_polymod(data, _hrp_polymod(hrp))
+    polymod = bech32_polymod(bytes(6), polymod) ^ 1
+    return bytearray([(polymod >> 5 * (5 - i)) & 31 for i in range(6)])
 
 
 def bech32_encode(hrp, data):
     """Compute a Bech32 string given HRP and data values."""
-    combined = data + bech32_create_checksum(hrp, data)
-    return hrp + "1" + "".join([CHARSET[d] for d in combined])
+    checksum = bech32_create_checksum(hrp, data)
+    return (
+        hrp
+        + "1"
+        + "".join([CHARSET[d] for d in data])
+        + "".join([CHARSET[d] for d in checksum])
+    )
 
 
 def bech32_decode(bech):
@@ -69,10 +117,13 @@ def bech32_decode(bech):
     pos = bech.rfind("1")
     if pos < 1 or pos + 7 > len(bech) or len(bech) > 90:
         return (None, None)
-    if not all(x in CHARSET for x in bech[pos + 1 :]):
-        return (None, None)
     hrp = bech[:pos]
-    data = [CHARSET.find(x) for x in bech[pos + 1 :]]
+    data = bytearray(len(bech) - pos - 1)
+    for i in range(len(data)):
+        d = CHARSET.find(bech[pos + 1 + i])
+        if d < 0:
+            return (None, None)
+        data[i] = d
     if not bech32_verify_checksum(hrp, data):
         return (None, None)
     return (hrp, data[:-6])
@@ -82,7 +133,10 @@ def convertbits(data, frombits, tobits, pad=True):
     """General power-of-2 base conversion."""
     acc = 0
     bits = 0
-    ret = []
+    # the output size is known upfront, so fill a preallocated buffer
+    n = len(data) * frombits
+    ret = bytearray((n + tobits - 1) // tobits if pad else n // tobits)
+    i = 0
     maxv = (1 << tobits) - 1
     max_acc = (1 << (frombits + tobits - 1)) - 1
     for value in data:
@@ -92,10 +146,11 @@ def convertbits(data, frombits, tobits, pad=True):
         bits += frombits
         while bits >= tobits:
             bits -= tobits
-            ret.append((acc >> bits) & maxv)
+            ret[i] = (acc >> bits) & maxv
+            i += 1
     if pad:
         if bits:
-            ret.append((acc << (tobits - bits)) & maxv)
+            ret[i] = (acc << (tobits - bits)) & maxv
     elif bits >= frombits or ((acc << (tobits - bits)) & maxv):
         return None
     return ret
@@ -118,7 +173,7 @@ def decode(hrp, addr):
 
 def encode(hrp, witver, witprog):
     """Encode a segwit address."""
-    ret = bech32_encode(hrp, [witver] + convertbits(witprog, 8, 5))
+    ret = bech32_encode(hrp, bytearray([witver]) + convertbits(witprog, 8, 5))
     if decode(hrp, ret) == (None, None):
         return None
     return ret
@@ -25,51 +25,136 @@ ADDRESS_TYPE_P2KH = 0
 ADDRESS_TYPE_P2SH = 8
 
 
-def cashaddr_polymod(values):
-    generator = [0x98F2BC8E61, 0x79B76D99E2, 0xF33E5FB3C4, 0xAE2EABE2A8, 0x1E4F43E470]
-    chk = 1
+# XOR of the generator constants selected by the top five bits of the checksum,
+# split into 20-bit halves so that the checksum state fits into small ints
+_GENERATOR_HI = (
+    0x00000,
+    0x98F2B,
+    0x79B76,
+    0xE145D,
+    0xF33E5,
+    0x6BCCE,
+    0x8A893,
+    0x127B8,
+    0xAE2EA,
+    0x36DC1,
+    0xD799C,
+    0x4F6B7,
+    0x5D10F,
+    0xC5E24,
+    0x24A79,
+    0xBC552,
+    0x1E4F4,
+    0x86BDF,
+    0x67F82,
+    0xFF0A9,
+    0xED711,
+    0x7583A,
+    0x94C67,
+    0x0C34C,
+    0xB061E,
+    0x28935,
+    0xC9D68,
+    0x51243,
+    0x435FB,
+    0xDBAD0,
+    0x3AE8D,
+    0xA21A6,
+)
+_GENERATOR_LO = (
+    0x00000,
+    0xC8E61,
+    0xD99E2,
+    0x11783,
+    0xFB3C4,
+    0x33DA5,
+    0x22A26,
+    0xEA447,
+    0xBE2A8,
+    0x76CC9,
+    0x67B4A,
+    0xAF52B,
+    0x4516C,
+    0x8DF0D,
+    0x9C88E,
+    0x546EF,
+    0x3E470,
+    0xF6A11,
+    0xE7D92,
+    0x2F3F3,
+    0xC57B4,
+    0x0D9D5,
+    0x1CE56,
+    0xD4037,
+    0x806D8,
+    0x488B9,
+    0x59F3A,
+    0x9115B,
+    0x7B51C,
+    0xB3B7D,
+    0xA2CFE,
+    0x6A29F,
+)
+
+
+def _polymod(values, hi, lo):
     for value in values:
-        top = chk >> 35
-        chk = ((chk & 0x07FFFFFFFF) << 5) ^ value
-        for i in range(5):
-            chk ^= generator[i] if (top & (1 << i)) else 0
-    return chk ^ 1
+        top = hi >> 15
+        hi = (((hi & 0x7FFF) << 5) | (lo >> 15)) ^ _GENERATOR_HI[top]
+        lo = (((lo & 0x7FFF) << 5) ^ value) ^ _GENERATOR_LO[top]
+    return hi, lo
+
+
+def cashaddr_polymod(values):
+    hi, lo = _polymod(values, 0, 1)
+    return ((hi << 20) | lo) ^ 1
 
 
 def prefix_expand(prefix):
-    return [ord(x) & 0x1F for x in prefix] + [0]
+    res = bytearray(len(prefix) + 1)
+    for i in range(len(prefix)):
+        res[i] = ord(prefix[i]) & 0x1F
+    return res
 
 
 def calculate_checksum(prefix, payload):
-    poly = cashaddr_polymod(prefix_expand(prefix) + payload + [0, 0, 0, 0, 0, 0, 0, 0])
-    out = list()
-    for i in range(8):
-        out.append((poly >> 5 * (7 - i)) & 0x1F)
+    hi, lo = _polymod(prefix_expand(prefix), 0, 1)
+    hi, lo = _polymod(payload, hi, lo)
+    hi, lo = _polymod(bytes(8), hi, lo)
+    lo ^= 1
+    out = bytearray(8)
+    for i in range(4):
+        out[i] = (hi >> 5 * (3 - i)) & 0x1F
+        out[i + 4] = (lo >> 5 * (3 - i)) & 0x1F
     return out
 
 
 def verify_checksum(prefix, payload):
-    return cashaddr_polymod(prefix_expand(prefix) + payload) == 0
+    hi, lo = _polymod(prefix_expand(prefix), 0, 1)
+    return _polymod(payload, hi, lo) == (0, 1)
 
 
 def b32decode(inputs):
-    out = list()
-    for letter in inputs:
-        out.append(CHARSET.find(letter))
+    out = bytearray(len(inputs))
+    for i in range(len(inputs)):
+        d = CHARSET.find(inputs[i])
+        if d < 0:
+            raise ValueError("Invalid cashaddr character")
+        out[i] = d
     return out
 
 
 def b32encode(inputs):
-    out = ""
-    for char_code in inputs:
-        out += CHARSET[char_code]
-    return out
+    return "".join([CHARSET[char_code] for char_code in inputs])
 
 
 def convertbits(data, frombits, tobits, pad=True):
     acc = 0
     bits = 0
-    ret = []
+    # the output size is known upfront, so fill a preallocated buffer
+    n = len(data) * frombits
+    ret = bytearray((n + tobits - 1) // tobits if pad else n // tobits)
+    i = 0
     maxv = (1 << tobits) - 1
     max_acc = (1 << (frombits + tobits - 1)) - 1
     for value in data:
@@ -79,10 +164,11 @@ def convertbits(data, frombits, tobits, pad=True):
         bits += frombits
         while bits >= tobits:
             bits -= tobits
-            ret.append((acc >> bits) & maxv)
+            ret[i] = (acc >> bits) & maxv
+            i += 1
     if pad:
         if bits:
-            ret.append((acc << (tobits - bits)) & maxv)
+            ret[i] = (acc << (tobits - bits)) & maxv
     elif bits >= frombits or ((acc << (tobits - bits)) & maxv):
         return None
     return ret
@@ -92,7 +178,7 @@ def encode(prefix, version, payload):
     payload = bytes([version]) + payload
     payload = convertbits(payload, 8, 5)
     checksum = calculate_checksum(prefix, payload)
-    return prefix + ":" + b32encode(payload + checksum)
+    return prefix + ":" + b32encode(payload) + b32encode(checksum)
 
 
 def decode(prefix, addr):
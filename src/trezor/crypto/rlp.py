@@ -20,23 +20,90 @@ def encode_length(l: int, is_list: bool) -> bytes:
 
 
 def encode(data, include_length=True) -> bytes:
+    w = bytearray()
+    write(w, data, include_length)
+    return bytes(w)
+
+
+def _int_length(x: int) -> int:
+    n = 0
+    while x:
+        n += 1
+        x >>= 8
+    return n
+
+
+def _write_int(w, x: int, n: int):
+    for shift in range(8 * (n - 1), -1, -8):
+        w.append((x >> shift) & 0xFF)
+
+
+def _header_length(l: int) -> int:
+    if l < 56:
+        return 1
+    return 1 + _int_length(l)
+
+
+def length(data, include_length=True) -> int:
+    """
+    Returns the length of `encode(data, include_length)` without encoding.
+    """
     if isinstance(data, int):
-        data = int_to_bytes(data)
-    if isinstance(data, bytearray):
-        data = bytes(data)
-    if isinstance(data, bytes):
-        if (len(data) == 1 and ord(data) < 128) or not include_length:
-            return data
-        else:
-            return encode_length(len(data), is_list=False) + data
+        n = _int_length(data)
+        if (n == 1 and data < 128) or not include_length:
+            return n
+        return 1 + n
+    elif isinstance(data, (bytes, bytearray)):
+        n = len(data)
+        if (n == 1 and data[0] < 128) or not include_length:
+            return n
+        return _header_length(n) + n
     elif isinstance(data, list):
-        output = b""
+        n = 0
         for item in data:
-            output += encode(item)
+            n += length(item)
+        if not include_length:
+            return n
+        return _header_length(n) + n
+    else:
+        raise TypeError("Invalid input of type " + str(type(data)))
+
+
+def write_length(w, l: int, is_list: bool):
+    offset = 0xC0 if is_list else 0x80
+    if l < 56:
+        w.append(l + offset)
+    elif l < 256 ** 8:
+        n = _int_length(l)
+        w.append(n + offset + 55)
+        _write_int(w, l, n)
+    else:
+        raise ValueError("Input too long")
+
+
+def write(w, data, include_length=True):
+    """
+    Writes `encode(data, include_length)` into `w`, a bytearray or any writer
+    with `append()` and `extend()`, such as `trezor.utils.HashWriter`.
+    """
+    if isinstance(data, int):
+        n = _int_length(data)
+        if (n != 1 or data >= 128) and include_length:
+            write_length(w, n, is_list=False)
+        _write_int(w, data, n)
+    elif isinstance(data, (bytes, bytearray)):
+        n = len(data)
+        if (n != 1 or data[0] >= 128) and include_length:
+            write_length(w, n, is_list=False)
+        w.extend(data)
+    elif isinstance(data, list):
         if include_length:
-            return encode_length(len(output), is_list=True) + output
-        else:
-            return output
+            n = 0
+            for item in data:
+                n += length(item)
+            write_length(w, n, is_list=True)
+        for item in data:
+            write(w, item)
     else:
         raise TypeError("Invalid input of type " + str(type(data)))
 
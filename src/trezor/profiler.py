@@ -0,0 +1,68 @@
+"""
+Records time and heap allocation of the boot phases (imports, app boot,
+first homescreen render), see `phase`.
+
+Profiling is available on the emulator only and is enabled by setting the
+TREZOR_PROFILER environment variable, `./emu.sh -b` does that and renders
+the result.  Once `dump` is called, every finished phase is printed as a
+line of the folded stack format of `vendor/flamegraph`, prefixed by the
+metric:
+
+    profile:time boot;unlock 12345
+    profile:alloc boot;unlock 2048
+
+Values are exclusive, i.e. they do not include the nested phases.
+"""
+
+import gc
+import utime
+
+from trezor import utils
+
+_enabled = utils.PROFILE
+_stack = []  # list of [name, start time, start alloc, nested time, nested alloc]
+_records = []  # list of (stack, time, alloc)
+
+
+class phase:
+    """
+    Context manager measuring the enclosed block as a phase called `name`.
+    Phases can be nested.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        if _enabled:
+            _stack.append([self.name, utime.ticks_us(), gc.mem_alloc(), 0, 0])
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if _enabled:
+            now = utime.ticks_us()
+            alloc = gc.mem_alloc()
+            stack = ";".join([entry[0] for entry in _stack])
+            name, start, start_alloc, nested, nested_alloc = _stack.pop()
+            elapsed = utime.ticks_diff(now, start)
+            allocated = alloc - start_alloc
+            _records.append((stack, elapsed - nested, allocated - nested_alloc))
+            if _stack:
+                _stack[-1][3] += elapsed
+                _stack[-1][4] += allocated
+
+
+def dump() -> None:
+    """
+    Prints the recorded phases and stops profiling.
+    """
+    global _enabled
+    if not _enabled:
+        return
+    for stack, elapsed, _ in _records:
+        print("profile:time %s %d" % (stack, elapsed))
+    for stack, _, allocated in _records:
+        # allocation is negative if garbage got collected during the phase
+        print("profile:alloc %s %d" % (stack, max(allocated, 0)))
+    print("profile:done")
+    _records.clear()
+    _enabled = False
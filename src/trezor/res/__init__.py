@@ -1,8 +1,16 @@
+from micropython import const
+
 try:
     from .resources import resdata
 except ImportError:
     resdata = None
 
+_CACHE_SIZE = const(8 * 1024)  # budget for decompressed images, in bytes
+
+_cache = {}
+_cache_order = []  # least recently used first
+_cache_used = 0
+
 
 def load(name):
     """
@@ -11,6 +19,36 @@ def load(name):
     return resdata[name]
 
 
+def load_decompressed(name):
+    """
+    Loads image resource of a given name, with pixel data decompressed for
+    faster drawing.  Recently used images are kept in RAM, up to
+    `_CACHE_SIZE` bytes in total, images larger than that are not cached.
+    """
+    global _cache_used
+
+    image = _cache.get(name)
+    if image is not None:
+        if _cache_order[-1] != name:
+            _cache_order.remove(name)
+            _cache_order.append(name)
+        return image
+
+    from trezor.ui import display
+
+    image = display.decompress(load(name))
+    size = len(image)
+    if size > _CACHE_SIZE:
+        return image
+    while _cache_used + size > _CACHE_SIZE:
+        evicted = _cache_order.pop(0)
+        _cache_used -= len(_cache.pop(evicted))
+    _cache[name] = image
+    _cache_order.append(name)
+    _cache_used += size
+    return image
+
+
 def gettext(message):
     """
     Returns localized string. This function is aliased to _.
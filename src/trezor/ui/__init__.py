@@ -5,12 +5,95 @@ from trezorui import Display
 
 from trezor import io, loop, res, utils, workflow
 
-display = Display()
+if __debug__ or utils.EMULATOR:
+
+    class _Compositor(Display):
+        """
+        Display which remembers whether anything was drawn since the last
+        refresh, so the after-step hook below can skip refreshing (and, on
+        the emulator, uploading the whole framebuffer) when a task step
+        did not touch the screen.
+        """
+
+        dirty = True
+
+        def refresh(self):
+            super().refresh()
+            self.dirty = False
+
+        def clear(self):
+            self.dirty = True
+            super().clear()
+
+        def bar(self, *args):
+            self.dirty = True
+            super().bar(*args)
+
+        def bar_radius(self, *args):
+            self.dirty = True
+            super().bar_radius(*args)
+
+        def image(self, *args):
+            self.dirty = True
+            super().image(*args)
+
+        def avatar(self, *args):
+            self.dirty = True
+            super().avatar(*args)
+
+        def icon(self, *args):
+            self.dirty = True
+            super().icon(*args)
+
+        def loader(self, *args):
+            self.dirty = True
+            super().loader(*args)
+
+        def print(self, *args):
+            self.dirty = True
+            super().print(*args)
+
+        def text(self, *args):
+            self.dirty = True
+            return super().text(*args)
+
+        def text_center(self, *args):
+            self.dirty = True
+            return super().text_center(*args)
+
+        def text_right(self, *args):
+            self.dirty = True
+            return super().text_right(*args)
+
+        def qrcode(self, *args):
+            self.dirty = True
+            super().qrcode(*args)
+
+        def qrcode_matrix(self, *args):
+            self.dirty = True
+            super().qrcode_matrix(*args)
+
+        def orientation(self, *args):
+            if args:
+                self.dirty = True
+            return super().orientation(*args)
+
+        def backlight(self, *args):
+            if args:
+                self.dirty = True
+            return super().backlight(*args)
+
+    display = _Compositor()
+
+else:
+    display = Display()
 
 # in debug mode, display an indicator in top right corner
 if __debug__:
 
     def debug_display_refresh():
+        if not display.dirty:
+            return
         display.bar(Display.WIDTH - 8, 0, 8, 8, 0xF800)
         display.refresh()
         if utils.SAVE_SCREEN:
@@ -20,7 +103,12 @@ if __debug__:
 
 # in both debug and production, emulator needs to draw the screen explicitly
 elif utils.EMULATOR:
-    loop.after_step_hook = display.refresh
+
+    def emulator_display_refresh():
+        if display.dirty:
+            display.refresh()
+
+    loop.after_step_hook = emulator_display_refresh
 
 # re-export constants from modtrezorui
 NORMAL = Display.FONT_NORMAL
@@ -77,6 +165,53 @@ def pulse(delay: int):
         yield 0.5 + 0.5 * math.sin(utime.ticks_us() / delay)
 
 
+_FRAME_US = const(1000000 // 30)  # 30 fps
+_animations = []  # list of (callback, signal) pairs
+_clock_running = False
+
+
+async def _frame_clock():
+    global _clock_running
+    sleep = loop.sleep(_FRAME_US)
+    try:
+        while _animations:
+            for entry in tuple(_animations):
+                callback, done = entry
+                try:
+                    running = callback()
+                except Exception as e:
+                    # stop only the failing animation, its animate() raises e
+                    _animations.remove(entry)
+                    done.send(e)
+                    continue
+                if not running:
+                    _animations.remove(entry)
+                    done.send(None)
+            yield sleep
+    finally:
+        _clock_running = False
+
+
+async def animate(callback):
+    """
+    Calls `callback` once per frame until it returns a falsy value.  All
+    running animations are drawn from a single clock task, so they share one
+    display refresh per frame, and the clock stops when none is left.  An
+    exception raised by `callback` is re-raised here.
+    """
+    global _clock_running
+    entry = (callback, loop.signal())
+    _animations.append(entry)
+    if not _clock_running:
+        _clock_running = True
+        loop.schedule(_frame_clock())
+    try:
+        await entry[1]  # raises the exception sent by the clock
+    finally:
+        if entry in _animations:
+            _animations.remove(entry)
+
+
 async def alert(count: int = 3):
     short_sleep = loop.sleep(20000)
     long_sleep = loop.sleep(80000)
@@ -104,12 +239,17 @@ async def click() -> tuple:
     return pos
 
 
-async def backlight_slide(val: int, delay: int = 35000, step: int = 20):
-    sleep = loop.sleep(delay)
+async def backlight_slide(val: int, step: int = 20):
     current = display.backlight()
-    for i in range(current, val, -step if current > val else step):
-        display.backlight(i)
-        yield sleep
+    steps = iter(range(current, val, -step if current > val else step))
+
+    def frame():
+        for i in steps:
+            display.backlight(i)
+            return True
+        return False
+
+    await animate(frame)
 
 
 def backlight_slide_sync(val: int, delay: int = 35000, step: int = 20):
@@ -152,7 +292,7 @@ def header(
     title: str, icon: bytes = ICON_DEFAULT, fg: int = FG, bg: int = BG, ifg: int = GREEN
 ):
     if icon is not None:
-        display.icon(14, 15, res.load(icon), ifg, bg)
+        display.icon(14, 15, res.load_decompressed(icon), ifg, bg)
     display.text(44, 35, title, BOLD, fg, bg)
 
 
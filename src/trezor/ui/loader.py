@@ -1,7 +1,7 @@
 import utime
 from micropython import const
 
-from trezor import loop, res, ui
+from trezor import res, ui
 
 _TARGET_MS = const(1000)
 _SHRINK_BY = const(2)
@@ -49,21 +49,25 @@ class Loader(ui.Widget):
         if s["icon"] is None:
             ui.display.loader(r, -24, s["fg-color"], s["bg-color"])
         elif s["icon-fg-color"] is None:
-            ui.display.loader(r, -24, s["fg-color"], s["bg-color"], res.load(s["icon"]))
+            ui.display.loader(
+                r, -24, s["fg-color"], s["bg-color"], res.load_decompressed(s["icon"])
+            )
         else:
             ui.display.loader(
                 r,
                 -24,
                 s["fg-color"],
                 s["bg-color"],
-                res.load(s["icon"]),
+                res.load_decompressed(s["icon"]),
                 s["icon-fg-color"],
             )
 
+    def frame(self):
+        if self.is_active():
+            self.render()
+        return self.is_active()
+
     def __iter__(self):
-        sleep = loop.sleep(1000000 // 30)  # 30 fps
         ui.display.bar(0, 32, ui.WIDTH, ui.HEIGHT - 83, ui.BG)  # clear
-        while self.is_active():
-            self.render()
-            yield sleep
+        yield from ui.animate(self.frame)
         ui.display.bar(0, 32, ui.WIDTH, ui.HEIGHT - 83, ui.BG)  # clear
@@ -75,7 +75,7 @@ class Input(Button):
         if i:  # icon
             ix = ax + aw - ICON * 2
             iy = ty - ICON
-            display.icon(ix, iy, res.load(i), fg_color, bg_color)
+            display.icon(ix, iy, res.load_decompressed(i), fg_color, bg_color)
 
 
 class MnemonicKeyboard(ui.Widget):
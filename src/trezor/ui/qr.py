@@ -1,5 +1,19 @@
 from trezor import ui
 
+# matrix of the last encoded QR code, as (data, matrix)
+_last_code = (None, None)
+
+
+def encode(data) -> bytes:
+    """
+    Returns QR code matrix of `data`.  The last one is remembered, so
+    showing the same code repeatedly does not encode it again.
+    """
+    global _last_code
+    if _last_code[0] != data:
+        _last_code = (data, ui.display.qrcode_encode(data))
+    return _last_code[1]
+
 
 class Qr(ui.Widget):
     def __init__(self, data, pos, scale):
@@ -8,4 +22,5 @@ class Qr(ui.Widget):
         self.scale = scale
 
     def render(self):
-        ui.display.qrcode(self.pos[0], self.pos[1], self.data, self.scale)
+        matrix = encode(self.data)
+        ui.display.qrcode_matrix(self.pos[0], self.pos[1], matrix, self.scale)
@@ -39,17 +39,19 @@ async def paginate(render_page, page_count, page=0, *args):
 
 
 async def animate_swipe():
-    time_delay = const(40000)
     draw_delay = const(200000)
 
     ui.display.text_center(130, 220, "Swipe", ui.BOLD, ui.GREY, ui.BG)
 
-    sleep = loop.sleep(time_delay)
-    icon = res.load(ui.ICON_SWIPE)
-    for t in ui.pulse(draw_delay):
-        fg = ui.blend(ui.GREY, ui.DARK_GREY, t)
+    icon = res.load_decompressed(ui.ICON_SWIPE)
+    pulse = ui.pulse(draw_delay)
+
+    def frame():
+        fg = ui.blend(ui.GREY, ui.DARK_GREY, next(pulse))
         ui.display.icon(70, 205, icon, fg, ui.BG)
-        yield sleep
+        return True
+
+    await ui.animate(frame)
 
 
 def render_scrollbar(page, page_count):
@@ -13,11 +13,43 @@ BR = const(-256)
 BR_HALF = const(-257)
 
 
-def render_text(words: list, new_lines: bool, max_lines: int) -> None:
-    # initial rendering state
+_glyph_widths = {}
+
+
+def glyph_widths(font: int) -> bytearray:
+    """
+    Returns advances of the printable ASCII glyphs of `font`, measured once
+    and cached.  Non-ASCII characters are rendered as "_".
+    """
+    widths = _glyph_widths.get(font)
+    if widths is None:
+        widths = bytearray(95)
+        for c in range(95):
+            widths[c] = ui.display.text_width(chr(c + 32), font)
+        _glyph_widths[font] = widths
+    return widths
+
+
+def _glyph_width(widths: bytearray, letter: str) -> int:
+    c = ord(letter)
+    if c < 32 or c == 127:
+        return 0
+    if c > 127:
+        c = 95  # "_"
+    return widths[c - 32]
+
+
+def layout_text(words: list, new_lines: bool, max_lines: int) -> list:
+    """
+    Computes line breaks and positions of `words` and returns a flat list
+    of runs, five items per run: x, y, text, font, fg.  The list can be
+    drawn repeatedly by `render_layout` without measuring the text again.
+    """
+    runs = []
+
+    # initial layout state
     font = ui.NORMAL
     fg = ui.FG
-    bg = ui.BG
     offset_x = TEXT_MARGIN_LEFT
     offset_y = TEXT_HEADER_HEIGHT + TEXT_LINE_HEIGHT
     OFFSET_X_MAX = ui.WIDTH
@@ -36,8 +68,8 @@ def render_text(words: list, new_lines: bool, max_lines: int) -> None:
             if word in [BR, BR_HALF]:
                 # line break or half-line break
                 if offset_y >= OFFSET_Y_MAX:
-                    ui.display.text(offset_x, offset_y, "...", ui.BOLD, ui.GREY, bg)
-                    return
+                    runs.extend((offset_x, offset_y, "...", ui.BOLD, ui.GREY))
+                    return runs
                 offset_x = TEXT_MARGIN_LEFT
                 offset_y += TEXT_LINE_HEIGHT if word == BR else TEXT_LINE_HEIGHT_HALF
             elif word in FONTS:
@@ -72,34 +104,33 @@ def render_text(words: list, new_lines: bool, max_lines: int) -> None:
                 split = "..."
                 splitw = ELLIPSIS
             # find span that fits
+            widths = glyph_widths(font)
             for index in range(len(word) - 1, 0, -1):
-                letter = word[index]
-                width -= ui.display.text_width(letter, font)
+                width -= _glyph_width(widths, word[index])
                 if offset_x + width + splitw < OFFSET_X_MAX:
                     break
             else:
                 index = 0
-            span = word[:index]
-            # render word span
-            ui.display.text(offset_x, offset_y, span, font, fg, bg)
-            ui.display.text(offset_x + width, offset_y, split, ui.BOLD, ui.GREY, bg)
+            # word span
+            runs.extend((offset_x, offset_y, word[:index], font, fg))
+            runs.extend((offset_x + width, offset_y, split, ui.BOLD, ui.GREY))
             # line break
             if offset_y >= OFFSET_Y_MAX:
-                return
+                return runs
             offset_x = TEXT_MARGIN_LEFT
             offset_y += TEXT_LINE_HEIGHT
             # continue with the rest
             word = word[index:]
             width = ui.display.text_width(word, font)
 
-        # render word
-        ui.display.text(offset_x, offset_y, word, font, fg, bg)
+        # word
+        runs.extend((offset_x, offset_y, word, font, fg))
 
         if new_lines and has_next_word:
             # line break
             if offset_y >= OFFSET_Y_MAX:
-                ui.display.text(offset_x, offset_y, "...", ui.BOLD, ui.GREY, bg)
-                return
+                runs.extend((offset_x, offset_y, "...", ui.BOLD, ui.GREY))
+                return runs
             offset_x = TEXT_MARGIN_LEFT
             offset_y += TEXT_LINE_HEIGHT
         else:
@@ -107,6 +138,19 @@ def render_text(words: list, new_lines: bool, max_lines: int) -> None:
             offset_x += width
             offset_x += SPACE
 
+    return runs
+
+
+def render_layout(runs: list) -> None:
+    text = ui.display.text
+    bg = ui.BG
+    for i in range(0, len(runs), 5):
+        text(runs[i], runs[i + 1], runs[i + 2], runs[i + 3], runs[i + 4], bg)
+
+
+def render_text(words: list, new_lines: bool, max_lines: int) -> None:
+    render_layout(layout_text(words, new_lines, max_lines))
+
 
 class Text(ui.Widget):
     def __init__(
@@ -123,28 +167,35 @@ class Text(ui.Widget):
         self.max_lines = max_lines
         self.new_lines = new_lines
         self.content = []
+        self.layout = None
 
     def normal(self, *content):
         self.content.append(ui.NORMAL)
         self.content.extend(content)
+        self.layout = None
 
     def bold(self, *content):
         self.content.append(ui.BOLD)
         self.content.extend(content)
+        self.layout = None
 
     def mono(self, *content):
         self.content.append(ui.MONO)
         self.content.extend(content)
+        self.layout = None
 
     def mono_bold(self, *content):
         self.content.append(ui.MONO_BOLD)
         self.content.extend(content)
+        self.layout = None
 
     def br(self):
         self.content.append(BR)
+        self.layout = None
 
     def br_half(self):
         self.content.append(BR_HALF)
+        self.layout = None
 
     def render(self):
         if self.tainted:
@@ -155,5 +206,7 @@ class Text(ui.Widget):
                 ui.BG,
                 self.icon_color,
             )
-            render_text(self.content, self.new_lines, self.max_lines)
+            if self.layout is None:
+                self.layout = layout_text(self.content, self.new_lines, self.max_lines)
+            render_layout(self.layout)
             self.tainted = False
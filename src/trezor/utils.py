@@ -23,6 +23,13 @@ if __debug__:
         TEST = 0
         SAVE_SCREEN = 0
 
+if EMULATOR:
+    import uos
+
+    PROFILE = int(uos.getenv("TREZOR_PROFILER") or "0")
+else:
+    PROFILE = 0
+
 
 def unimport_begin():
     return set(sys.modules)
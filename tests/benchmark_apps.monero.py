@@ -0,0 +1,196 @@
+"""
+Performance and memory benchmark of the on-device Monero signing primitives.
+
+Run with the unix port from the tests directory:
+
+    ../build/unix/micropython -O1 -X heapsize=64M benchmark_apps.monero.py
+
+Each line of the report contains the case name, number of runs, average
+time per run in milliseconds, the highest heap usage above the usage at the
+start of a run and the average number of bytes allocated per run, both as
+counted by gc.mem_alloc().
+
+Automatic collection is disabled while a case runs, so the heap is only
+shrunk by the explicit gc.collect() calls of the measured code.  These are
+routed through State.mem_trace(), which records the heap usage right before
+each of them, so its high-water mark is the real peak of the run.  The
+memory freed by these collections is counted too, so the allocation is
+the total of everything allocated, temporaries included.  The heap has to
+be large enough to hold everything allocated between two collections.
+Keep the output of two firmware versions and diff them to spot regressions.
+"""
+
+from common import *
+
+import gc
+import utime
+
+from trezor.messages.MoneroRctKeyPublic import MoneroRctKeyPublic
+from trezor.messages.MoneroTransferDetails import MoneroTransferDetails
+
+from apps.monero.signing.state import State
+from apps.monero.xmr import (
+    bulletproof,
+    crypto,
+    key_image,
+    mlsag,
+    monero,
+    range_signatures,
+)
+from apps.monero.xmr.credentials import AccountCreds
+from apps.monero.xmr.serialize_messages.ct_keys import CtKey
+
+BP_OUTPUTS = (1, 2, 4, 16)
+MLSAG_RING_SIZES = (11, 16, 32)
+KEY_IMAGE_EXPORTS = 16
+
+
+class _TracedGc:
+    """
+    Stands in for the `gc` module in the measured modules, so their
+    explicit collections record the heap usage and the memory they free.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.freed = 0
+
+    def collect(self):
+        alloc = gc.mem_alloc()
+        self.state.mem_trace(collect=True)
+        self.freed += alloc - gc.mem_alloc()
+
+
+class Benchmark:
+    def __init__(self):
+        self.state = State(None)
+        self.traced_gc = _TracedGc(self.state)
+        for module in (bulletproof, mlsag, range_signatures):
+            module.gc = self.traced_gc
+        self.results = []
+
+    def run(self, name, fnc, repeat=1):
+        res = None
+        elapsed = 0
+        peak = 0
+        allocated = 0
+        for _ in range(repeat):
+            res = None
+            gc.collect()
+            gc.disable()
+            try:
+                self.state.mem_peak = 0
+                self.traced_gc.freed = 0
+                alloc = gc.mem_alloc()
+                start = utime.ticks_us()
+                res = fnc()
+                elapsed += utime.ticks_diff(utime.ticks_us(), start)
+                self.state.mem_trace()
+                peak = max(peak, self.state.mem_peak - alloc)
+                allocated += gc.mem_alloc() - alloc + self.traced_gc.freed
+            finally:
+                gc.enable()
+        self.results.append(
+            (name, repeat, elapsed // repeat, peak, allocated // repeat)
+        )
+        return res
+
+    def report(self):
+        print(
+            "%-24s %6s %12s %10s %10s"
+            % ("case", "runs", "time [ms]", "peak [B]", "alloc [B]")
+        )
+        for name, repeat, elapsed, peak, allocated in self.results:
+            print(
+                "%-24s %6d %12d.%03d %10d %10d"
+                % (name, repeat, elapsed // 1000, elapsed % 1000, peak, allocated)
+            )
+
+
+def bench_bulletproofs(bench):
+    for outputs in BP_OUTPUTS:
+        amounts = [(i + 1) * 1000000 for i in range(outputs)]
+        masks = [crypto.random_scalar() for _ in range(outputs)]
+        proof = bench.run(
+            "bp_prove_%d" % outputs,
+            lambda: range_signatures.prove_range_bp_batch(amounts, masks),
+        )
+        res = bench.run(
+            "bp_verify_%d" % outputs,
+            lambda: range_signatures.verify_bp(proof, amounts, masks),
+        )
+        assert res
+        del proof
+        gc.collect()
+
+
+def _mlsag_input(ring_size, index, amount):
+    spend_key = crypto.random_scalar()
+    mask = crypto.random_scalar()
+    pubs = []
+    for i in range(ring_size):
+        if i == index:
+            dest = crypto.scalarmult_base(spend_key)
+            commitment = crypto.gen_commitment(mask, amount)
+        else:
+            dest = crypto.scalarmult_base(crypto.random_scalar())
+            commitment = crypto.scalarmult_base(crypto.random_scalar())
+        pubs.append(
+            MoneroRctKeyPublic(
+                dest=crypto.encodepoint(dest), commitment=crypto.encodepoint(commitment)
+            )
+        )
+    return pubs, CtKey(dest=spend_key, mask=mask)
+
+
+def bench_mlsag(bench):
+    message = crypto.random_bytes(32)
+    amount = 1000000
+    for ring_size in MLSAG_RING_SIZES:
+        index = ring_size // 2
+        pubs, in_sk = _mlsag_input(ring_size, index, amount)
+        alpha = crypto.random_scalar()
+        cout = crypto.gen_commitment(alpha, amount)
+
+        def sign():
+            mg_buff = []
+            mlsag.generate_mlsag_simple(
+                message, list(pubs), in_sk, alpha, cout, None, index, mg_buff
+            )
+            return mg_buff
+
+        mg_buff = bench.run("mlsag_%d" % ring_size, sign)
+        assert len(mg_buff) == ring_size + 2
+
+
+def bench_key_image(bench):
+    creds = AccountCreds.new_wallet(crypto.random_scalar(), crypto.random_scalar())
+    subaddresses = monero.compute_subaddresses(creds, 0, [0])
+
+    tds = []
+    for i in range(KEY_IMAGE_EXPORTS):
+        tx_priv = crypto.random_scalar()
+        derivation = crypto.generate_key_derivation(creds.view_key_public, tx_priv)
+        out_key = crypto.derive_public_key(derivation, i, creds.spend_key_public)
+        tds.append(
+            MoneroTransferDetails(
+                out_key=crypto.encodepoint(out_key),
+                tx_pub_key=crypto.encodepoint(crypto.scalarmult_base(tx_priv)),
+                additional_tx_pub_keys=[],
+                internal_output_index=i,
+            )
+        )
+
+    def export():
+        for td in tds:
+            key_image.export_key_image(creds, subaddresses, td)
+
+    bench.run("key_image_export_%d" % KEY_IMAGE_EXPORTS, export)
+
+
+if __name__ == "__main__":
+    bench = Benchmark()
+    bench_mlsag(bench)
+    bench_key_image(bench)
+    bench_bulletproofs(bench)
+    bench.report()
@@ -1,10 +1,17 @@
 from common import *
 
 from apps.cardano.cbor import (
+    EncodedCbor,
     Tagged,
     IndefiniteLengthArray,
-    encode
+    decode,
+    decode_path,
+    encode,
+    encode_into,
+    encoded_len,
 )
+from trezor.crypto import hashlib
+from trezor.utils import HashWriter
 from ubinascii import unhexlify
 
 class TestCardanoCbor(unittest.TestCase):
@@ -51,6 +58,74 @@ class TestCardanoCbor(unittest.TestCase):
         for val, expected in test_vectors:
             encoded = encode(val)
             self.assertEqual(unhexlify(expected), encoded)
+            self.assertEqual(encoded_len(val), len(encoded))
+
+    def test_cbor_encode_into(self):
+        value = [IndefiniteLengthArray([[0, EncodedCbor([b'\x01' * 32, 2])]]), {}]
+        encoded = encode(value)
+        self.assertEqual(encoded, encode([IndefiniteLengthArray([[0, Tagged(24, encode([b'\x01' * 32, 2]))]]), {}]))
+
+        w = bytearray(b'\x82')
+        encode_into(w, value)
+        self.assertEqual(w, b'\x82' + encoded)
+
+        w = HashWriter(hashlib.blake2b(outlen=32))
+        encode_into(w, value)
+        self.assertEqual(w.get_digest(), hashlib.blake2b(data=encoded, outlen=32).digest())
+
+    def test_cbor_decoding(self):
+        test_vectors = [
+            # integers
+            ('00', 0),
+            ('17', 23),
+            ('1818', 24),
+            ('1903e8', 1000),
+            ('1a000f4240', 1000000),
+            ('1b000000e8d4a51000', 1000000000000),
+
+            # binary strings
+            ('40', b''),
+            ('4401020304', unhexlify('01020304')),
+
+            # raw cbor tag
+            ('d8184401020304', unhexlify('01020304')),
+
+            # arrays
+            ('80', []),
+            ('8301820203820405', [1, [2, 3], [4, 5]]),
+            ('98190102030405060708090a0b0c0d0e0f101112131415161718181819', list(range(1, 26))),
+
+            # maps
+            ('a0', {}),
+            ('a203040102', {1: 2, 3: 4}),
+
+            # indefinite
+            ('9fff', []),
+            ('9f18ff1819ff', [255, 25]),
+            ('9f018202039f0405ffff', [1, [2, 3], [4, 5]]),
+        ]
+        for encoded, expected in test_vectors:
+            self.assertEqual(decode(unhexlify(encoded)), expected)
+
+        with self.assertRaises(ValueError):
+            decode(unhexlify('0000'))
+
+    def test_cbor_decode_path(self):
+        # [[1, 2], [[b'a', 10], [b'b', 20]], {}]
+        tx = unhexlify('8382010282824161' '0a82416214a0')
+        self.assertEqual(decode_path(tx, (1, 0, 1)), 10)
+        self.assertEqual(decode_path(tx, (1, 1, 1)), 20)
+        self.assertEqual(decode_path(tx, (1, 1)), [b'b', 20])
+        self.assertEqual(decode_path(tx, (0,)), [1, 2])
+        self.assertEqual(decode_path(tx, ()), decode(tx))
+
+        indefinite = unhexlify('9f018202039f0405ffff')
+        self.assertEqual(decode_path(indefinite, (2, 1)), 5)
+
+        with self.assertRaises(IndexError):
+            decode_path(tx, (1, 2, 1))
+        with self.assertRaises(IndexError):
+            decode_path(indefinite, (3,))
 
 if __name__ == '__main__':
     unittest.main()
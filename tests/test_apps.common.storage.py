@@ -4,6 +4,22 @@ from trezor import config
 from apps.common import storage
 
 
+class CountingConfig:
+    """
+    Stands in for `config` in the storage module and counts the writes.
+    """
+
+    def __init__(self):
+        self.writes = 0
+
+    def get(self, *args):
+        return config.get(*args)
+
+    def set(self, *args):
+        self.writes += 1
+        config.set(*args)
+
+
 class TestConfig(unittest.TestCase):
 
     def test_counter(self):
@@ -19,6 +35,71 @@ class TestConfig(unittest.TestCase):
         storage.set_u2f_counter(None)
         self.assertEqual(storage.next_u2f_counter(), 0)
 
+    def test_cached_settings(self):
+        config.init()
+        storage.wipe()
+        self.assertEqual(config.unlock(pin_to_int("")), True)
+        storage.init_unlocked()
+        self.assertEqual(storage.get_label(), None)
+        storage.load_settings(label="first")
+        self.assertEqual(storage.get_label(), "first")
+        storage.load_settings(label="second", use_passphrase=True)
+        self.assertEqual(storage.get_label(), "second")
+        self.assertEqual(storage.has_passphrase(), True)
+        storage.load_settings(label="second", use_passphrase=False)
+        self.assertEqual(storage.get_label(), "second")
+        self.assertEqual(storage.has_passphrase(), False)
+        storage.set_flags(0x0F)
+        storage.set_flags(0x30)
+        self.assertEqual(storage.get_flags(), 0x3F)
+        storage.wipe()
+        self.assertEqual(config.unlock(pin_to_int("")), True)
+        storage.init_unlocked()
+        self.assertEqual(storage.get_label(), None)
+        self.assertEqual(storage.has_passphrase(), False)
+        self.assertEqual(storage.get_flags(), 0)
+
+    def test_cache_dropped_after_lock(self):
+        config.init()
+        storage.wipe()
+        self.assertEqual(config.unlock(pin_to_int("")), True)
+        storage.init_unlocked()
+        storage.load_settings(use_passphrase=True)
+        self.assertEqual(storage.has_passphrase(), True)
+        # private values must not survive a lock, even if the storage
+        # was changed without going through the cache
+        config.lock()
+        config.wipe()
+        self.assertEqual(config.unlock(pin_to_int("")), True)
+        storage.init_unlocked()
+        self.assertEqual(storage.has_passphrase(), False)
+
+    def test_unchanged_settings_not_written(self):
+        config.init()
+        storage.wipe()
+        self.assertEqual(config.unlock(pin_to_int("")), True)
+        storage.init_unlocked()
+        counting = CountingConfig()
+        storage.config = counting
+        try:
+            storage.load_settings(label="label")
+            self.assertEqual(counting.writes, 1)
+            storage.load_settings(label="label")
+            self.assertEqual(counting.writes, 1)
+            # an unset value reads as False already
+            storage.load_settings(use_passphrase=False)
+            self.assertEqual(counting.writes, 1)
+            storage.store_mnemonic(
+                b"secret", 0, needs_backup=False, no_backup=False
+            )
+            # only the secret, the mnemonic type and the storage version
+            self.assertEqual(counting.writes, 4)
+            storage.load_settings(use_passphrase=True)
+            self.assertEqual(counting.writes, 5)
+            self.assertEqual(storage.has_passphrase(), True)
+        finally:
+            storage.config = config
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,37 @@
+from common import *
+from apps.ethereum.abi import decode_erc20_call
+
+
+class TestEthereumAbi(unittest.TestCase):
+
+    def test_decode_erc20_call(self):
+        to = unhexlify('d0a1e359811322d97991e03f863a0c30c2cf029c')
+        sender = unhexlify('7dd7f56d697cc0f2b52bd55c057f378f1fe6ab4b')
+        amount = unhexlify('0000000000000000000000000000000000000000000000000de0b6b3a7640000')
+
+        data = unhexlify('a9059cbb000000000000000000000000') + to + amount
+        self.assertEqual(decode_erc20_call(data), ('transfer', [to, 10 ** 18]))
+
+        data = unhexlify('095ea7b3000000000000000000000000') + to + amount
+        self.assertEqual(decode_erc20_call(bytearray(data)), ('approve', [to, 10 ** 18]))
+
+        data = unhexlify('23b872dd000000000000000000000000') + sender + unhexlify('000000000000000000000000') + to + amount
+        self.assertEqual(decode_erc20_call(data), ('transferFrom', [sender, to, 10 ** 18]))
+
+    def test_decode_erc20_call_invalid(self):
+        to = unhexlify('d0a1e359811322d97991e03f863a0c30c2cf029c')
+        amount = bytes(32)
+
+        # unknown selector
+        self.assertIsNone(decode_erc20_call(unhexlify('deadbeef000000000000000000000000') + to + amount))
+        # too short
+        self.assertIsNone(decode_erc20_call(unhexlify('a9059cbb000000000000000000000000') + to))
+        self.assertIsNone(decode_erc20_call(b''))
+        # trailing data
+        self.assertIsNone(decode_erc20_call(unhexlify('a9059cbb000000000000000000000000') + to + amount + b'\x00'))
+        # address with non-zero padding
+        self.assertIsNone(decode_erc20_call(unhexlify('a9059cbb000000000000000000000001') + to + amount))
+
+
+if __name__ == '__main__':
+    unittest.main()
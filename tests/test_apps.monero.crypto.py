@@ -233,6 +233,28 @@ class TestMoneroCrypto(unittest.TestCase):
         )
         self.assertEqual(pkey_ex, crypto.encodepoint(pkey_comp))
 
+    def test_subaddress_table(self):
+        table = monero.SubaddressTable()
+        keys = []
+        for major in range(3):
+            table.reserve(40)
+            for minor in range(40):
+                key = crypto.encodepoint(
+                    crypto.scalarmult_base(crypto.sc_init(1 + major * 40 + minor))
+                )
+                table[key] = (major, minor)
+                keys.append((key, (major, minor)))
+
+        self.assertEqual(len(table), 120)
+        for key, index in keys:
+            self.assertTrue(key in table)
+            self.assertEqual(table.get(key), index)
+            self.assertEqual(table[key], index)
+
+        missing = crypto.encodepoint(crypto.scalarmult_base(crypto.sc_init(1000)))
+        self.assertFalse(missing in table)
+        self.assertIsNone(table.get(missing))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,159 @@
+from common import *
+
+from trezor.messages.MoneroRctKeyPublic import MoneroRctKeyPublic
+
+from apps.monero.xmr import crypto, mlsag
+from apps.monero.xmr.serialize_messages.ct_keys import CtKey
+
+
+def _scalar(seed, i=0):
+    return crypto.hash_to_scalar(b"mlsag " + seed + bytes([i]))
+
+
+def _point(seed, i=0):
+    return crypto.scalarmult_base(_scalar(seed, i))
+
+
+def _ring(ring_size, index, amount):
+    """
+    Deterministic ring of (P, C) where the `index` column belongs to the signer
+    """
+    spend_key = _scalar(b"spend")
+    mask = _scalar(b"mask")
+    pubs = []
+    for i in range(ring_size):
+        if i == index:
+            dest = crypto.scalarmult_base(spend_key)
+            commitment = crypto.gen_commitment(mask, amount)
+        else:
+            dest = _point(b"dest", i)
+            commitment = _point(b"commitment", i)
+        pubs.append(
+            MoneroRctKeyPublic(
+                dest=crypto.encodepoint(dest), commitment=crypto.encodepoint(commitment)
+            )
+        )
+    return pubs, CtKey(dest=spend_key, mask=mask)
+
+
+def _ss(mg_buff, i, rows):
+    col = mg_buff[i + 1]
+    offset = len(col) - 32 * rows
+    return [
+        crypto.decodeint(col[offset + 32 * j : offset + 32 * j + 32])
+        for j in range(rows)
+    ]
+
+
+def _challenge(message, pk, II, rows, ds_rows, i, ss, c_old):
+    """
+    Challenge of the column following `i`, as computed by the former
+    pure-Python MLSAG loop
+    """
+    hasher = crypto.get_keccak()
+    hasher.update(message)
+    for j in range(rows):
+        pk_ij = pk[32 * (i * rows + j) : 32 * (i * rows + j) + 32]
+        L = crypto.add_keys2(ss[j], c_old, crypto.decodepoint(pk_ij))
+        hasher.update(pk_ij)
+        hasher.update(crypto.encodepoint(L))
+        if j < ds_rows:
+            Hi = crypto.hash_to_point(pk_ij)
+            Ii = crypto.decodepoint(II[32 * j : 32 * j + 32])
+            R = crypto.add_keys3(ss[j], Hi, c_old, Ii)
+            hasher.update(crypto.encodepoint(R))
+    return crypto.decodeint(hasher.digest())
+
+
+def _chain(message, pk, II, rows, ds_rows, index, mg_buff, c_old):
+    cols = len(pk) // (32 * rows)
+    cc = None
+    i = (index + 1) % cols
+    if i == 0:
+        cc = c_old
+    while i != index:
+        c_old = _challenge(
+            message, pk, II, rows, ds_rows, i, _ss(mg_buff, i, rows), c_old
+        )
+        i = (i + 1) % cols
+        if i == 0:
+            cc = c_old
+    return c_old, cc
+
+
+def _verify(message, pubs, cout, II, mg_buff):
+    """
+    Recomputes the challenge chain over the whole ring starting with cc
+    """
+    rows = 2
+    cols = len(pubs)
+    M = bytearray(32 * rows * cols)
+    for i in range(cols):
+        M[32 * i * rows : 32 * i * rows + 32] = pubs[i].dest
+        C = crypto.point_sub(crypto.decodepoint(pubs[i].commitment), cout)
+        M[32 * i * rows + 32 : 32 * (i + 1) * rows] = crypto.encodepoint(C)
+
+    cc = crypto.decodeint(mg_buff[-1])
+    c = cc
+    for i in range(cols):
+        c = _challenge(message, M, II, rows, 1, i, _ss(mg_buff, i, rows), c)
+    return crypto.sc_eq(c, cc)
+
+
+class TestMoneroMlsag(unittest.TestCase):
+    def test_mlsag_chain(self):
+        rows = 2
+        ds_rows = 1
+        cols = 11
+        message = crypto.cn_fast_hash(b"mlsag chain")
+        pk = bytearray()
+        for i in range(cols * rows):
+            pk.extend(crypto.encodepoint(_point(b"pk", i)))
+        II = crypto.encodepoint(_point(b"key image"))
+
+        for index in (0, 5, cols - 1):
+            mg_buff = [None] + [bytearray(1 + 32 * rows) for _ in range(cols)]
+            c_first = _scalar(b"c", index)
+
+            c = crypto.new_scalar()
+            crypto.sc_copy(c, c_first)
+            cc = crypto.new_scalar()
+            crypto.mlsag_chain(
+                c, cc, message, pk, II, rows, ds_rows, index, mg_buff, 1
+            )
+
+            exp_c, exp_cc = _chain(
+                message, pk, II, rows, ds_rows, index, mg_buff, c_first
+            )
+            self.assertTrue(crypto.sc_eq(c, exp_c))
+            self.assertTrue(crypto.sc_eq(cc, exp_cc))
+            # the signer's column is left for the caller
+            self.assertEqual(mg_buff[index + 1], bytearray(1 + 32 * rows))
+
+    def test_generate_mlsag_simple(self):
+        amount = 1000000
+        message = crypto.cn_fast_hash(b"mlsag message")
+        a = _scalar(b"pseudo out mask")
+        cout = crypto.gen_commitment(a, amount)
+
+        for ring_size in (11, 16):
+            for index in (0, ring_size // 2, ring_size - 1):
+                pubs, in_sk = _ring(ring_size, index, amount)
+                mg_buff = []
+                mlsag.generate_mlsag_simple(
+                    message, list(pubs), in_sk, a, cout, None, index, mg_buff
+                )
+                self.assertEqual(len(mg_buff), ring_size + 2)
+
+                Hi = crypto.hash_to_point(pubs[index].dest)
+                II = crypto.encodepoint(crypto.scalarmult(Hi, in_sk.dest))
+                self.assertTrue(_verify(message, pubs, cout, II, mg_buff))
+
+                # a different message must not verify
+                self.assertFalse(
+                    _verify(crypto.cn_fast_hash(message), pubs, cout, II, mg_buff)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
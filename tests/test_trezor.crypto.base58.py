@@ -72,6 +72,23 @@ class TestCryptoBase58(unittest.TestCase):
         ('03e7595c3e6b58f907bee951dc29796f3757307e700ecf3d09307a0cc4a564eba3', '8b82mpnH8YX1E9RHnU2a2YgLTZ8ooevEGP9N15c1yFqhoBvJur'),
     ]
 
+    def test_encode_decode(self):
+        vectors = [
+            ('', ''),
+            ('00', '1'),
+            ('0000', '11'),
+            ('61', '2g'),
+            ('626262', 'a3gV'),
+            ('00000000000000000000', '1111111111'),
+            ('00eb15231dfceb60925886b67d065299925915aeb172c06647', '1NS17iag9jJgTHD1VXjvLCEnZuQ3rJDE9L'),
+        ]
+        for a, b in vectors:
+            self.assertEqual(base58.encode(unhexlify(a)), b)
+            self.assertEqual(base58.decode(b), unhexlify(a))
+
+        with self.assertRaises(ValueError):
+            base58.decode('0OIl')
+
     def test_decode_check(self):
         for a, b in self.vectors:
             self.assertEqual(base58.decode_check(b), unhexlify(a))
@@ -120,6 +120,27 @@ class TestCryptoBip39(unittest.TestCase):
         for m in v:
             self.assertEqual(bip39.check(m), False)
 
+    def test_find_word(self):
+        self.assertEqual(bip39.find_word(''), None)
+        self.assertEqual(bip39.find_word('a'), 'abandon')
+        self.assertEqual(bip39.find_word('abl'), 'able')
+        self.assertEqual(bip39.find_word('act'), 'act')
+        self.assertEqual(bip39.find_word('actr'), 'actress')
+        self.assertEqual(bip39.find_word('zoo'), 'zoo')
+        self.assertEqual(bip39.find_word('zoom'), None)
+        self.assertEqual(bip39.find_word('xy'), None)
+
+    def test_complete_word(self):
+        def mask(letters):
+            return sum(1 << (ord(c) - ord('a')) for c in letters)
+
+        self.assertEqual(bip39.complete_word(''), 0xFFFFFFFF)
+        self.assertEqual(bip39.complete_word('ab'), mask('ailosu'))
+        self.assertEqual(bip39.complete_word('act'), mask('ioru'))
+        self.assertEqual(bip39.complete_word('zo'), mask('no'))
+        self.assertEqual(bip39.complete_word('zoo'), 0)
+        self.assertEqual(bip39.complete_word('xy'), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
 from common import *
 
-from trezor.crypto import rlp
+from trezor.crypto import hashlib, rlp
+from trezor.utils import HashWriter
 
 
 class TestCryptoRlp(unittest.TestCase):
@@ -64,6 +65,20 @@ class TestCryptoRlp(unittest.TestCase):
             o2 = rlp.encode(i)
             self.assertEqual(o, o2)
 
+    def test_rlp_write(self):
+
+        for i, o in self.vectors:
+            o = unhexlify(o)
+            self.assertEqual(rlp.length(i), len(o))
+
+            w = bytearray()
+            rlp.write(w, i)
+            self.assertEqual(w, o)
+
+            h = HashWriter(hashlib.sha256())
+            rlp.write(h, i)
+            self.assertEqual(h.get_digest(), hashlib.sha256(o).digest())
+
 
 if __name__ == '__main__':
     unittest.main()
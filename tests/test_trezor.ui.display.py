@@ -38,6 +38,14 @@ class TestDisplay(unittest.TestCase):
     def test_qrcode(self):
         display.qrcode(0, 0, 'Test', 4)
 
+    def test_qrcode_matrix(self):
+        matrix = display.qrcode_encode('Test')
+        self.assertEqual(matrix[0], 21)
+        self.assertEqual(len(matrix), (21 * 21 + 7) // 8 + 1)
+        display.qrcode_matrix(0, 0, matrix, 4)
+        with self.assertRaises(ValueError):
+            display.qrcode_matrix(0, 0, matrix[:-1], 4)
+
     def test_loader(self):
         display.loader(333, 0, 0xFFFF, 0x0000)
 